@@ -0,0 +1,281 @@
+"""
+Compares the answers and speed of StaticResolver against the import-based imports_submodule, which defines the
+semantics of IMR241 and IMR242.
+
+Synthetic package layouts are generated from templates covering the cases that are hard to answer without importing:
+namespace packages, lazy module __getattr__, re-exported submodules, attributes shadowing submodules, and modules that
+fail to import. Installed packages can be compared as well; their queries are the submodules found on disk and the
+names bound in their __init__ files.
+
+    python benchmarks/differential.py --layouts 2000
+    python benchmarks/differential.py --layouts 0 --packages email json xml
+
+A mismatch is a query that both sides answer, but differently. The exit code is 1 if there are any.
+"""
+
+import argparse
+import ast
+import importlib
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from flake8_import_restrictions.imports_submodule import imports_submodule
+from flake8_import_restrictions.static_resolver import StaticResolver
+
+# Contents of a package's __init__ file. {sub} is a submodule of the package, {name} is not.
+INIT_TEMPLATES = [
+    "",
+    "def {sub}(): pass\n",
+    "{sub} = 1\n",
+    "from . import {sub}\n",
+    "from .{sub} import value as {name}\n",
+    "import {package}.{sub}\n",
+    "import os as {name}\n",
+    "from os import path as {name}\n",
+    "class {name}: pass\n",
+    "from .{sub} import *\n",
+    "try:\n    from . import {sub}\nexcept ImportError:\n    {sub} = None\n",
+    "if False:\n    from . import {sub}\n",
+    "def __getattr__(name):\n"
+    "    if name == '{name}':\n"
+    "        return importlib.import_module('.{sub}', __name__)\n"
+    "    raise AttributeError(name)\n"
+    "import importlib\n",
+    "from .{sub} import {sub}\n",
+]
+# Contents of a submodule.
+MODULE_TEMPLATES = [
+    "value = 1\n",
+    "def {sub}(): pass\nvalue = {sub}\n",
+    "import os as value\n",
+    "raise RuntimeError('fails on import')\n",
+]
+# Installed modules with side effects on import, which are never queried.
+UNSAFE_NAMES = {
+    "antigravity",
+    "this",
+    "idlelib",
+    "turtle",
+    "__main__",
+    "__init__",
+}
+
+# A query "from module import name" with the answers of both sides.
+Comparison = Tuple[str, str, Optional[bool], Optional[bool]]
+
+
+def generate_layout(
+    directory: str, package: str, rng: random.Random, depth: int = 0
+) -> List[Tuple[str, str]]:
+    """Writes a random package to the given directory. Returns the (module, name) queries to compare."""
+    path = os.path.join(directory, *package.split("."))
+    os.makedirs(path)
+    subs = [f"sub_{i}" for i in range(rng.randint(1, 3))]
+    queries = [(package, sub) for sub in subs] + [
+        (package, "name"),
+        (package, "missing"),
+    ]
+    for sub in subs:
+        if depth < 2 and rng.random() < 0.3:
+            queries += generate_layout(
+                directory, f"{package}.{sub}", rng, depth + 1
+            )
+        else:
+            with open(os.path.join(path, sub + ".py"), "w") as file:
+                file.write(rng.choice(MODULE_TEMPLATES).format(sub=sub))
+    if rng.random() >= 0.2:  # otherwise a namespace package
+        with open(os.path.join(path, "__init__.py"), "w") as file:
+            for template in rng.sample(INIT_TEMPLATES, rng.randint(1, 3)):
+                file.write(
+                    template.format(
+                        package=package, sub=rng.choice(subs), name="name"
+                    )
+                )
+    return queries
+
+
+def installed_queries(
+    resolver: StaticResolver, packages: Iterable[str]
+) -> List[Tuple[str, str]]:
+    """Returns queries for the submodules and the names bound in the __init__ files of the given packages."""
+    queries = []
+    for package in packages:
+        spec = resolver.find_spec(package)
+        if spec is None or spec[1] is None:
+            continue
+        names = set()
+        for location in spec[1]:
+            for entry in os.listdir(location):
+                stem = entry.partition(".")[0]
+                if stem.isidentifier() and stem not in UNSAFE_NAMES:
+                    names.add(stem)
+        if spec[0] is not None and spec[0].endswith(".py"):
+            names |= _bound_names(spec[0])
+        queries += [(package, name) for name in sorted(names)]
+    return queries
+
+
+def compare(
+    queries: Sequence[Tuple[str, str]], resolver: StaticResolver
+) -> Tuple[List[Comparison], float, float]:
+    """Answers all queries with both sides. Returns the answers and the seconds spent by each side."""
+    start = time.perf_counter()
+    static = [resolver.resolve(module, name) for module, name in queries]
+    static_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    truth = [_import_truth(module, name) for module, name in queries]
+    import_seconds = time.perf_counter() - start
+    return (
+        [
+            (module, name, static_result, truth_result)
+            for (module, name), static_result, truth_result in zip(
+                queries, static, truth
+            )
+        ],
+        static_seconds,
+        import_seconds,
+    )
+
+
+def run_layouts(
+    layouts: int, seed: int
+) -> Tuple[List[Comparison], float, float]:
+    """Generates the given number of synthetic layouts and compares both sides on them."""
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        queries = []
+        for index in range(layouts):
+            queries += generate_layout(
+                directory, f"imr_layout_{seed}_{index}", rng
+            )
+        sys.path.insert(0, directory)
+        importlib.invalidate_caches()
+        try:
+            return compare(queries, StaticResolver(sys.path))
+        finally:
+            sys.path.remove(directory)
+            for module in list(sys.modules):
+                if module.startswith(f"imr_layout_{seed}_"):
+                    del sys.modules[module]
+
+
+def summarize(
+    label: str,
+    comparisons: List[Comparison],
+    static_seconds: float,
+    import_seconds: float,
+) -> Dict[str, int]:
+    counts = {"queries": len(comparisons), "static": 0, "import errors": 0}
+    mismatches = []
+    for module, name, static, truth in comparisons:
+        if static is None:
+            continue
+        counts["static"] += 1
+        if truth is None:
+            counts["import errors"] += 1
+        elif static != truth:
+            mismatches.append((module, name, static, truth))
+    counts["mismatches"] = len(mismatches)
+    print(
+        f"{label}: {counts['queries']} queries, {counts['static']} answered statically, "
+        f"{counts['mismatches']} mismatches, {counts['import errors']} failed to import"
+    )
+    print(
+        f"{'':>{len(label)}}  static {static_seconds * 1000:.1f} ms, import {import_seconds * 1000:.1f} ms "
+        f"({import_seconds / max(static_seconds, 1e-9):.1f}x)"
+    )
+    for module, name, static, truth in mismatches:
+        print(f"  from {module} import {name}: static {static}, import {truth}")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--layouts", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--packages",
+        nargs="*",
+        default=[],
+        help="Installed packages to compare on. 'all' selects every top level package on sys.path, importing all of "
+        "their submodules.",
+    )
+    args = parser.parse_args()
+    mismatches = 0
+    if args.layouts:
+        counts = summarize("synthetic", *run_layouts(args.layouts, args.seed))
+        mismatches += counts["mismatches"]
+    if args.packages:
+        resolver = StaticResolver(sys.path + [os.getcwd()])
+        packages = args.packages
+        if packages == ["all"]:
+            packages = sorted(
+                {
+                    entry.partition(".")[0]
+                    for path in sys.path
+                    if os.path.isdir(path)
+                    for entry in os.listdir(path)
+                }
+            )
+        packages = [
+            package
+            for package in packages
+            if package.isidentifier() and package not in UNSAFE_NAMES
+        ]
+        queries = installed_queries(resolver, packages)
+        counts = summarize("installed", *compare(queries, resolver))
+        mismatches += counts["mismatches"]
+    sys.exit(1 if mismatches else 0)
+
+
+def _import_truth(module: str, name: str) -> Optional[bool]:
+    try:
+        result = imports_submodule("__init__.py", 0, module, name)
+    except SystemExit:  # scripts calling sys.exit() on import
+        return None
+    submodule = f"{module}.{name}"
+    if result is False and submodule not in sys.modules:
+        # imports_submodule also answers False if the submodule exists but raises an ImportError itself.
+        try:
+            if importlib.util.find_spec(submodule) is not None:
+                return None
+        except Exception:  # pylint: disable=broad-except
+            return None
+    return result
+
+
+def _bound_names(filename: str) -> set:
+    try:
+        with open(filename, "rb") as file:
+            tree = ast.parse(file.read(), filename)
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    names = set()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names |= {
+                (alias.asname or alias.name).partition(".")[0]
+                for alias in node.names
+                if alias.name != "*"
+            }
+        elif isinstance(node, ast.Assign):
+            names |= {
+                target.id
+                for target in node.targets
+                if isinstance(target, ast.Name)
+            }
+    return names
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares the memory needed to hold all imports of a corpus as ASTs and as ImportRecords.
+
+    python benchmarks/import_records.py --imports 1000000
+"""
+
+import argparse
+import ast
+import gc
+import random
+import tracemalloc
+
+from flake8_import_restrictions.import_records import collect_imports
+
+STATEMENTS = [
+    "import {module}",
+    "import {module} as {alias}",
+    "from {module} import {name}",
+    "from {module} import {name} as {alias}, {name}_2",
+    "from .{module} import {name}",
+]
+
+
+def generate_sources(imports: int, per_file: int, modules: int):
+    rng = random.Random(0)
+    names = [f"package_{i % 20}.module_{i}" for i in range(modules)]
+    for start in range(0, imports, per_file):
+        yield "\n".join(
+            rng.choice(STATEMENTS).format(
+                module=rng.choice(names),
+                name=f"name_{rng.randrange(1000)}",
+                alias=f"alias_{rng.randrange(1000)}",
+            )
+            for _ in range(min(per_file, imports - start))
+        )
+
+
+def measure(imports: int, per_file: int, modules: int, as_records: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    kept = []
+    for source in generate_sources(imports, per_file, modules):
+        tree = ast.parse(source)
+        kept.append(collect_imports(tree) if as_records else tree)
+        del tree
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--imports", type=int, default=1_000_000)
+    parser.add_argument("--per-file", type=int, default=200)
+    parser.add_argument("--modules", type=int, default=5000)
+    args = parser.parse_args()
+    for label, as_records in [("ast", False), ("records", True)]:
+        size = measure(args.imports, args.per_file, args.modules, as_records)
+        print(
+            f"{label:>8}: {size / 2**20:8.1f} MiB, {size / args.imports:6.0f} bytes per import"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compares scan_imports, which the standalone checker uses to find import statements, against parsing each file with
+ast.parse and walking the tree with collect_imports.
+
+    python benchmarks/import_scanner.py
+    python benchmarks/import_scanner.py path/to/project --repeat 3
+
+Defaults to the standard library. Files that the scanner leaves to ast.parse are timed with both steps, like in the
+checker. A mismatch is a file for which the scanner returns different records than collect_imports; the exit code is
+1 if there are any.
+"""
+
+import argparse
+import ast
+import os
+import sys
+import sysconfig
+import time
+from typing import List, Tuple
+
+from flake8_import_restrictions.import_records import collect_imports
+from flake8_import_restrictions.import_scanner import scan_imports
+from flake8_import_restrictions.standalone import (
+    iter_python_files,
+    read_source,
+)
+
+
+def load_sources(paths: List[str]) -> List[Tuple[str, str]]:
+    """Returns the filenames and contents of all Python files below the given paths that parse."""
+    sources = []
+    for filename in iter_python_files(paths):
+        source = read_source(filename)
+        if source is None:
+            continue
+        try:
+            ast.parse(source, filename)
+        except (SyntaxError, ValueError):
+            continue
+        sources.append((filename, source))
+    return sources
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "paths", nargs="*", default=[sysconfig.get_paths()["stdlib"]]
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+    sources = load_sources(args.paths)
+    megabytes = sum(len(source) for _, source in sources) / 1e6
+
+    parse_seconds = scan_seconds = float("inf")
+    fallbacks: List[str] = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for filename, source in sources:
+            collect_imports(ast.parse(source, filename))
+        parse_seconds = min(parse_seconds, time.perf_counter() - start)
+
+        fallbacks = []
+        start = time.perf_counter()
+        for filename, source in sources:
+            if scan_imports(source) is None:
+                fallbacks.append(filename)
+                collect_imports(ast.parse(source, filename))
+        scan_seconds = min(scan_seconds, time.perf_counter() - start)
+
+    mismatches = []
+    for filename, source in sources:
+        records = scan_imports(source)
+        if records is not None and records != collect_imports(
+            ast.parse(source, filename)
+        ):
+            mismatches.append(filename)
+
+    print(f"{len(sources)} files, {megabytes:.1f} MB")
+    print(
+        f"ast.parse + collect_imports: {parse_seconds:.2f} s "
+        f"({megabytes / parse_seconds:.1f} MB/s)"
+    )
+    print(
+        f"scan_imports:                {scan_seconds:.2f} s "
+        f"({megabytes / scan_seconds:.1f} MB/s, "
+        f"{parse_seconds / scan_seconds:.1f}x)"
+    )
+    print(
+        f"left to ast.parse: {len(fallbacks)} files "
+        f"({100 * len(fallbacks) / max(len(sources), 1):.1f}%)"
+    )
+    print(f"mismatches: {len(mismatches)}")
+    for filename in mismatches:
+        print(f"  {os.path.relpath(filename)}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compares the memory of checking a corpus with and without --imr_restore_modules.
+
+The corpus consists of files with from-imports of generated pure Python dependencies and of the top level modules of
+the standard library, all of which the checker has to import to resolve IMR241 and IMR242. Each configuration runs
+in a fresh process.
+
+    python benchmarks/restore_modules.py --files 500 --dependencies 200
+"""
+
+import argparse
+import os
+import pkgutil
+import random
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import time
+
+CHILD = """
+import resource, sys
+from flake8_import_restrictions import __main__
+__main__.main(sys.argv[1:])
+with open("/proc/self/statm") as file:
+    rss = int(file.read().split()[1]) * resource.getpagesize()
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+print(len(sys.modules), rss, peak, file=sys.stderr)
+"""
+# Modules with side effects on import.
+UNSAFE_MODULES = {"antigravity", "this", "idlelib", "turtle", "tkinter"}
+
+
+def stdlib_modules():
+    stdlib = sysconfig.get_paths()["stdlib"]
+    return sorted(
+        module.name
+        for module in pkgutil.iter_modules([stdlib])
+        if not module.name.startswith("_") and module.name not in UNSAFE_MODULES
+    )
+
+
+def generate_corpus(directory: str, files: int, dependencies: int):
+    rng = random.Random(0)
+    functions = "".join(
+        f"def function_{i}(x):\n    return [x] * {i}\n" for i in range(200)
+    )
+    for index in range(dependencies):
+        package = os.path.join(directory, f"dependency_{index}")
+        os.mkdir(package)
+        with open(os.path.join(package, "__init__.py"), "w") as file:
+            file.write(
+                f"TABLE = {{i: str(i) * 8 for i in range({index} + 2000)}}\n"
+            )
+            file.write(functions)
+    modules = stdlib_modules() + [
+        f"dependency_{index}" for index in range(dependencies)
+    ]
+    for index in range(files):
+        with open(os.path.join(directory, f"file_{index}.py"), "w") as file:
+            for module in rng.sample(modules, min(20, len(modules))):
+                file.write(f"from {module} import name_{index}\n")
+
+
+def measure(directory: str, extra_args):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, ".", *extra_args],
+        cwd=directory,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=False,
+    )
+    seconds = time.perf_counter() - start
+    modules, rss, peak = result.stderr.split()[-3:]
+    return int(modules), int(rss), int(peak), seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--dependencies", type=int, default=200)
+    parser.add_argument(
+        "--batches",
+        type=int,
+        nargs="*",
+        default=[1, 10, 100],
+        help="Values of --imr_restore_modules to compare.",
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        generate_corpus(directory, args.files, args.dependencies)
+        for label, extra_args in [("default", [])] + [
+            (f"every {files}", [f"--imr_restore_modules={files}"])
+            for files in args.batches
+        ]:
+            modules, rss, peak, seconds = measure(directory, extra_args)
+            print(
+                f"{label:>9}: {modules:5d} modules left, RSS {rss / 2**20:6.1f} MiB, peak {peak / 2**20:6.1f} MiB, {seconds:5.1f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
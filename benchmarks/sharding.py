@@ -0,0 +1,57 @@
+"""
+Measures how evenly --shard splits the work, which bounds how far adding CI nodes can reduce the wall time.
+
+All files are checked once, in a single process and with static resolution only, to measure the seconds each file
+costs. The files are then partitioned into 2, 4, ... shards, once weighted by file size alone, as on a first run
+without --cache, and once by the measured costs, as on later runs. The wall time of a sharded run is that of its most
+expensive shard; the speedup over a single node is reported for each shard count.
+
+    python benchmarks/sharding.py
+    python benchmarks/sharding.py path/to/project --shards 2 4 8 16 32
+"""
+
+import argparse
+import sysconfig
+import time
+
+from flake8_import_restrictions import standalone
+from flake8_import_restrictions.sharding import partition
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "paths", nargs="*", default=[sysconfig.get_paths()["stdlib"]]
+    )
+    parser.add_argument(
+        "--shards", type=int, nargs="+", default=[2, 4, 8, 16, 32]
+    )
+    args = parser.parse_args()
+    standalone.parse_args(
+        ["--imr_static_resolution", "--imr_no_import_fallback"]
+    )
+
+    costs = {}
+    for filename in standalone.iter_python_files(args.paths):
+        start = time.perf_counter()
+        standalone.check_file(filename)
+        costs[filename] = time.perf_counter() - start
+    total = sum(costs.values())
+    print(f"{len(costs)} files, {total:.2f} s on a single node")
+    print(f"{'shards':>6}  {'by size':>18}  {'by cost':>18}")
+    for count in args.shards:
+        speedups = []
+        for weights in ({}, costs):
+            shards = partition(costs, count, weights)
+            slowest = max(
+                sum(costs[filename] for filename in shard) for shard in shards
+            )
+            speedups.append(f"{total / slowest:6.2f}x ({slowest:.2f} s)")
+        print(f"{count:>6}  {speedups[0]:>18}  {speedups[1]:>18}")
+
+
+if __name__ == "__main__":
+    main()
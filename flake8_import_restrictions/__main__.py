@@ -0,0 +1,96 @@
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+from flake8_import_restrictions import daemon, sharding, standalone, watch
+from flake8_import_restrictions.archives import is_archive
+from flake8_import_restrictions.checker import ImportChecker
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    options = standalone.parse_args(argv)
+    if options.daemon:
+        daemon.serve(sys.stdin.buffer, sys.stdout.buffer)
+        return 0
+    if options.watch:
+        try:
+            watch.Watcher(options.paths).run(options.watch_interval, _print)
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if options.merge:
+        return _merge(options.merge, options.cache)
+    cache = _load_cache(options.cache)
+    environment = sharding.environment()
+    if cache is not None and cache.environment == environment:
+        ImportChecker.resolutions.update(cache.resolutions)
+    changed_lines = ImportChecker.changed_lines
+    filenames = [
+        filename
+        for filename in standalone.iter_python_files(options.paths)
+        # nothing to check otherwise, skip parsing the file
+        if changed_lines is None or changed_lines.touches(filename)
+    ]
+    if options.shard is not None:
+        index, count = options.shard
+        costs = cache.costs if cache is not None else {}
+        filenames = sharding.partition(filenames, count, costs)[index - 1]
+    results = sharding.ShardResults([], {}, {}, environment)
+    for filename in filenames:
+        start = time.perf_counter()
+        if is_archive(filename):
+            reports = standalone.check_archive(filename)
+        else:
+            reports = standalone.check_file(filename)
+        results.costs[filename] = time.perf_counter() - start
+        results.reports += reports
+        for report in reports:
+            print(standalone.format_report(report))
+    if options.results:
+        results.resolutions = sharding.cacheable_resolutions(
+            ImportChecker.resolutions
+        )
+        results.save(options.results)
+    return 1 if results.reports else 0
+
+
+def _merge(paths: Sequence[str], cache_path: Optional[str]) -> int:
+    """Prints the combined reports of the given shard results and writes the cache for the next run."""
+    try:
+        merged = sharding.ShardResults.merge(
+            [sharding.ShardResults.load(path) for path in paths]
+        )
+    except (OSError, ValueError) as error:
+        print(f"cannot merge results: {error}", file=sys.stderr)
+        return 2
+    for report in merged.reports:
+        print(standalone.format_report(report))
+    if cache_path:
+        sharding.ShardResults(
+            [], merged.costs, merged.resolutions, merged.environment
+        ).save(cache_path)
+    return 1 if merged.reports else 0
+
+
+def _load_cache(path: Optional[str]) -> Optional[sharding.ShardResults]:
+    if not path:
+        return None
+    try:
+        return sharding.ShardResults.load(path)
+    except (OSError, ValueError):
+        return None  # e.g. the first run, the cache is only a speed-up
+
+
+def _print(results: Dict[str, List[standalone.Report]]) -> None:
+    for filename in sorted(results):
+        for report in results[filename]:
+            print(standalone.format_report(report))
+    print(
+        f"-- checked {len(results)} file(s), "
+        f"{sum(len(reports) for reports in results.values())} error(s) --",
+        flush=True,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+import functools
+import importlib.util
+import os
+import posixpath
+import stat
+import tarfile
+import zipfile
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from flake8_import_restrictions.static_resolver import StaticResolver
+
+ZIP_SUFFIXES = (".whl", ".zip", ".pyz", ".egg")
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz", ".tar.xz")
+# Members whose contents are kept.
+MEMBER_SUFFIXES = (".py", ".pyi")
+PACKAGE_MARKERS = ("__init__.py", "__init__.pyi")
+# Raised for archives that are corrupt or not archives at all.
+ARCHIVE_ERRORS = (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError)
+
+
+def is_archive(path: str) -> bool:
+    return path.lower().endswith(ZIP_SUFFIXES + TAR_SUFFIXES)
+
+
+class Archive:
+    """
+    The files of a zip or tar archive, such as a wheel, an sdist, or a zipapp.
+    The archive is read in a single streaming pass without extracting anything. Python source and stub files are kept
+    in memory, of all other files only the names are kept.
+
+    :param path The archive file. Zip archives may be prefixed with a shebang line, like zipapps.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.files: List[str] = []
+        self.sources: Dict[str, bytes] = {}
+        if path.lower().endswith(TAR_SUFFIXES):
+            with tarfile.open(path, "r|*") as archive:
+                for member in archive:
+                    if member.isfile():
+                        self._add(
+                            member.name,
+                            functools.partial(
+                                _read_tar_member, archive, member
+                            ),
+                        )
+        else:
+            with zipfile.ZipFile(path) as archive:
+                for info in archive.infolist():
+                    if not info.is_dir():
+                        self._add(
+                            info.filename,
+                            functools.partial(archive.read, info),
+                        )
+        self._packages = {
+            posixpath.dirname(name)
+            for name in self.files
+            if posixpath.basename(name) in PACKAGE_MARKERS
+        }
+
+    def roots(self) -> List[str]:
+        """
+        Returns the directories of the archive that act like entries of sys.path: for every Python file, the closest
+        directory that is not a regular package. Usually "" for wheels and zipapps, and "name-1.0" or "name-1.0/src"
+        for sdists.
+        """
+        roots = {self._root_of(name) for name in self.sources}
+        return sorted(roots, key=lambda root: (root.count("/"), root))
+
+    def module_name(self, member: str) -> Optional[str]:
+        """Returns the name under which the given member can be imported from its root."""
+        directory = posixpath.dirname(member)
+        root = self._root_of(member)
+        parts = posixpath.relpath(directory, root or ".").split("/")
+        parts = [part for part in parts if part != "."]
+        stem = posixpath.basename(member).partition(".")[0]
+        if stem != "__init__":
+            parts.append(stem)
+        return ".".join(parts) or None
+
+    def _root_of(self, member: str) -> str:
+        directory = posixpath.dirname(member)
+        while directory and directory in self._packages:
+            directory = posixpath.dirname(directory)
+        return directory
+
+    def _add(self, name: str, read: Callable[[], bytes]) -> None:
+        name = posixpath.normpath(name.lstrip("/"))
+        if name == ".." or name.startswith("../"):
+            return
+        self.files.append(name)
+        if name.endswith(MEMBER_SUFFIXES):
+            self.sources[name] = read()
+
+
+def _read_tar_member(
+    archive: tarfile.TarFile, member: tarfile.TarInfo
+) -> bytes:
+    file = archive.extractfile(member)
+    return file.read() if file is not None else b""
+
+
+class ArchiveResolver(StaticResolver):
+    """
+    Resolves imports between the modules of an archive without extracting or importing anything.
+    Members are addressed as if the archive was a directory, e.g. "dist/foo.whl/foo/__init__.py", like zipimport does,
+    and the roots of the archive take the place of sys.path. Module names are only meaningful within the archive.
+
+    :param archive The archive.
+    :param fallback Resolves modules outside of the archive that modules in the archive refer to, if given.
+    """
+
+    def __init__(
+        self, archive: Archive, fallback: Optional[StaticResolver] = None
+    ):
+        self.archive = archive
+        self.base = os.path.abspath(archive.path)
+        self.fallback = fallback
+        super().__init__(
+            [self.path_of(root) for root in archive.roots()], max_workers=1
+        )
+        for path in self.search_paths:
+            self._roots[path] = stat.S_IFDIR
+        for name in archive.files:
+            parts = name.split("/")
+            for index, part in enumerate(parts):
+                directory = self.path_of("/".join(parts[:index]))
+                self._listings.setdefault(directory, {})[part] = (
+                    stat.S_IFREG if index == len(parts) - 1 else stat.S_IFDIR
+                )
+
+    def path_of(self, member: str) -> str:
+        return (
+            os.path.join(self.base, *member.split("/")) if member else self.base
+        )
+
+    def member_of(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.base).replace(
+            os.path.sep, "/"
+        )
+
+    def provides(self, module: str) -> bool:
+        """Tests whether the top level package of the given module is part of the archive."""
+        return self.find_spec(module.partition(".")[0]) is not None
+
+    def absolute_module(
+        self, filename: str, level: int, from_: str
+    ) -> Optional[str]:
+        if level == 0:
+            return from_
+        member = self.member_of(filename)
+        module = self.archive.module_name(member)
+        if module is None:
+            return None
+        if posixpath.basename(member).partition(".")[0] != "__init__":
+            module = module.rpartition(".")[0]
+        if not module:
+            return None
+        try:
+            return importlib.util.resolve_name("." * level + from_, module)
+        except (ImportError, ValueError):
+            return None
+
+    def resolve(
+        self, module: str, import_: str, depth: int = 0
+    ) -> Optional[bool]:
+        if not self.provides(module):
+            if self.fallback is None:
+                return None
+            return self.fallback.resolve(module, import_, depth)
+        return super().resolve(module, import_, depth)
+
+    def prefetch(self, imports: Iterable[Tuple[str, str]]) -> None:
+        pass  # all listings are in memory already
+
+    def _listdir(self, directory: str) -> Optional[Dict[str, int]]:
+        return self._listings.get(directory)
+
+    def _read(self, path: str) -> bytes:
+        try:
+            return self.archive.sources[self.member_of(path)]
+        except KeyError as error:
+            raise OSError(
+                f"{path} is not a source file of the archive"
+            ) from error
@@ -0,0 +1,167 @@
+import bisect
+import os
+import re
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+from flake8_import_restrictions.import_records import ImportRecord
+
+_FILE_HEADER = re.compile(r"^\+\+\+ (.*)$")
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+# The escape sequences git uses in quoted paths, besides octal escapes of single bytes.
+_ESCAPES = {
+    b"a": b"\a",
+    b"b": b"\b",
+    b"t": b"\t",
+    b"n": b"\n",
+    b"v": b"\v",
+    b"f": b"\f",
+    b"r": b"\r",
+    b'"': b'"',
+    b"\\": b"\\",
+}
+_ESCAPE = re.compile(rb"\\([0-7]{3}|.)", re.DOTALL)
+
+
+class ChangedLines:
+    """
+    The lines added or modified by a range of git revisions, per file.
+    Only import statements overlapping these lines are checked, so imports that are not part of a change never reach
+    the rules or the resolvers. Lines that were only deleted leave nothing behind to check.
+
+    :param ranges For each absolute, case-normalized filename, the sorted and disjoint (first, last) line ranges.
+    """
+
+    def __init__(self, ranges: Dict[str, List[Tuple[int, int]]]):
+        self._starts = {
+            filename: [first for first, _ in file_ranges]
+            for filename, file_ranges in ranges.items()
+        }
+        self._ends = {
+            filename: [last for _, last in file_ranges]
+            for filename, file_ranges in ranges.items()
+        }
+
+    @staticmethod
+    def from_git(revisions: str, directory: str = ".") -> "ChangedLines":
+        """
+        Runs `git diff` on the given revisions (anything `git diff` accepts, e.g. "origin/main...HEAD" or "HEAD" for
+        uncommitted changes) in the repository containing the given directory.
+
+        Raises ValueError if git cannot be run, the directory is not part of a git work tree, or the revisions are
+        invalid. The message includes what git printed to stderr.
+        """
+        root = _git(["rev-parse", "--show-toplevel"], directory).strip()
+        diff = _git(
+            [
+                "-c",
+                "core.quotePath=false",
+                "diff",
+                "--unified=0",
+                "--no-color",
+                "--no-ext-diff",
+                "--src-prefix=a/",
+                "--dst-prefix=b/",
+                "--diff-filter=AMR",
+                *revisions.split(),
+                "--",
+            ],
+            root,
+        )
+        return ChangedLines(parse_diff(diff, root))
+
+    def touches(self, filename: str) -> bool:
+        """Returns True if any line of the given file was changed."""
+        return _normalize(filename) in self._starts
+
+    def filter(
+        self, filename: str, records: List[ImportRecord]
+    ) -> List[ImportRecord]:
+        """Returns the import statements of the given file that overlap a changed line."""
+        filename = _normalize(filename)
+        starts = self._starts.get(filename)
+        if not starts:
+            return []
+        ends = self._ends[filename]
+        return [
+            record
+            for record in records
+            if _overlaps(starts, ends, record.lineno, record.end_lineno)
+        ]
+
+
+def parse_diff(diff: str, root: str) -> Dict[str, List[Tuple[int, int]]]:
+    """Parses the output of `git diff --unified=0` into the changed line ranges of each file below the given root."""
+    ranges: Dict[str, List[Tuple[int, int]]] = {}
+    file_ranges: Optional[List[Tuple[int, int]]] = None
+    # Added lines may look like headers as well, e.g. an added "++ x", so headers are only expected before the hunks.
+    in_header = False
+    for line in diff.split("\n"):
+        if line.startswith("diff --git "):
+            file_ranges = None
+            in_header = True
+            continue
+        header = _FILE_HEADER.match(line) if in_header else None
+        if header:
+            path = _unquote(header[1])
+            if path.startswith("b/"):
+                filename = _normalize(os.path.join(root, path[2:]))
+                file_ranges = ranges.setdefault(filename, [])
+            else:
+                file_ranges = None
+            continue
+        hunk = _HUNK_HEADER.match(line)
+        if hunk is None:
+            continue
+        in_header = False
+        first = int(hunk[1])
+        count = int(hunk[2]) if hunk[2] is not None else 1
+        if file_ranges is not None and count > 0:
+            file_ranges.append((first, first + count - 1))
+    return ranges
+
+
+def _overlaps(
+    starts: List[int], ends: List[int], first: int, last: int
+) -> bool:
+    index = bisect.bisect_right(starts, last) - 1
+    return index >= 0 and ends[index] >= first
+
+
+def _unquote(path: str) -> str:
+    """
+    Reverts the quoting of a path in a file header of git. Paths with special characters are enclosed in quotes and
+    use C-style escapes, where non-ASCII characters are escaped byte by byte. Unquoted paths containing spaces are
+    followed by a tab.
+    """
+    if not (len(path) >= 2 and path[0] == path[-1] == '"'):
+        return path[:-1] if path.endswith("\t") else path
+    return _ESCAPE.sub(
+        lambda match: (
+            bytes([int(match[1], 8)])
+            if len(match[1]) == 3
+            else _ESCAPES.get(match[1], match[1])
+        ),
+        path[1:-1].encode("utf-8", "surrogateescape"),
+    ).decode("utf-8", "surrogateescape")
+
+
+def _git(args: List[str], directory: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=directory,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+            errors="surrogateescape",
+        ).stdout
+    except subprocess.CalledProcessError as error:
+        raise ValueError(error.stderr.strip() or str(error)) from error
+    except OSError as error:
+        raise ValueError(f"cannot run git: {error}") from error
+
+
+def _normalize(filename: str) -> str:
+    return os.path.normcase(os.path.realpath(filename))
@@ -1,17 +1,50 @@
 import argparse
 import ast
-import fnmatch
+import multiprocessing
+import os
+import sys
+import types
 from collections import defaultdict
 
 try:
     from importlib import metadata
 except ImportError:
     import importlib_metadata as metadata
-from typing import Dict, Iterable, List, Tuple, Union
-
+from typing import (
+    Container,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
+
+import flake8.exceptions
 import flake8.options.manager
 
-from flake8_import_restrictions.imports_submodule import imports_submodule
+from flake8_import_restrictions.archives import ArchiveResolver
+from flake8_import_restrictions.changed_lines import ChangedLines
+from flake8_import_restrictions.directory_config import (
+    DirectoryRules,
+    compile_rules,
+)
+from flake8_import_restrictions.import_records import (
+    ImportRecord,
+    collect_imports,
+)
+from flake8_import_restrictions.imports_submodule import (
+    absolute_module,
+    imports_submodule,
+    restore_modules,
+)
+from flake8_import_restrictions.shared_cache import (
+    SharedResolutionCache,
+    open_shared_cache,
+)
+from flake8_import_restrictions.static_resolver import StaticResolver
+from flake8_import_restrictions.targets import parse_targets
 
 ALL_ERRORS = {
     200,
@@ -50,11 +83,37 @@ class ImportChecker:
     targetted_modules: Dict[int, Tuple[List[str], List[str]]] = defaultdict(
         lambda: ([], [])
     )
-
-    def __init__(self, tree: ast.AST, filename: str):
+    lazy_modules: Set[str] = set()
+    static_resolver: Optional[StaticResolver] = None
+    import_fallback: bool = True
+    # Resolvers for the target environments of --imr_targets, by name.
+    targets: Dict[str, StaticResolver] = {}
+    resolutions: Dict[Tuple[str, str], Optional[bool]] = {}
+    shared_cache: Optional[SharedResolutionCache] = None
+    changed_lines: Optional[ChangedLines] = None
+    restore_modules: int = 0
+    module_snapshot: Optional[Dict[str, types.ModuleType]] = None
+    files_since_snapshot: int = 0
+
+    directory_rules: Optional[DirectoryRules] = None
+
+    def __init__(self, tree: Optional[ast.AST], filename: str):
         self.tree = tree
         assert isinstance(filename, str)
         self.filename = filename
+        # Collected from the tree by run(). Callers that found the imports without parsing pass no tree instead.
+        self.records: List[ImportRecord] = []
+        # Set for files inside of an archive, whose imports refer to the archive's own modules.
+        self.archive: Optional[ArchiveResolver] = None
+        if ImportChecker.directory_rules is not None:
+            self.rules = ImportChecker.directory_rules.rules_for(filename)
+        else:
+            self.rules = compile_rules(
+                {
+                    error: ImportChecker.targetted_modules[error]
+                    for error in ALL_ERRORS
+                }
+            )
 
     @staticmethod
     def add_options(option_manager: flake8.options.manager.OptionManager):
@@ -75,6 +134,76 @@ class ImportChecker:
                 parse_from_config=True,
                 help=f"List of modules that IMR{error} is *not* applied to. Overwrites the _include flag. Allows UNIX wildcards.",
             )
+        option_manager.add_option(
+            "--imr200_import_times",
+            type=str,
+            default="",
+            parse_from_config=True,
+            help="Output of `python -X importtime` used to allow local imports of slow-to-import modules in IMR200.",
+        )
+        option_manager.add_option(
+            "--imr200_lazy_threshold",
+            type=float,
+            default=0.0,
+            parse_from_config=True,
+            help="Cumulative import time (in milliseconds) from which IMR200 allows local imports of a module. 0 disables the allowlist.",
+        )
+        option_manager.add_option(
+            "--imr_static_resolution",
+            action="store_true",
+            parse_from_config=True,
+            help="For IMR241 and IMR242, determine whether an import is a submodule from the file system where possible instead of importing it.",
+        )
+        option_manager.add_option(
+            "--imr_resolver_threads",
+            type=int,
+            default=8,
+            parse_from_config=True,
+            help="Number of threads used to prefetch file system lookups for --imr_static_resolution.",
+        )
+        option_manager.add_option(
+            "--imr_stub_paths",
+            type=str,
+            comma_separated_list=True,
+            default=[],
+            parse_from_config=True,
+            help="Additional directories containing stub files consulted by --imr_static_resolution.",
+        )
+        option_manager.add_option(
+            "--imr_no_import_fallback",
+            action="store_true",
+            parse_from_config=True,
+            help="Never import modules for IMR241 and IMR242, even if --imr_static_resolution cannot determine a result.",
+        )
+        option_manager.add_option(
+            "--imr_shared_cache_slots",
+            type=int,
+            default=65536,
+            parse_from_config=True,
+            help="Size of the shared memory table through which parallel jobs share the results of IMR241 and IMR242. 0 disables sharing.",
+        )
+        option_manager.add_option(
+            "--imr_diff",
+            type=str,
+            default="",
+            parse_from_config=True,
+            help="Only check import statements on lines changed by these git revisions, e.g. origin/main...HEAD.",
+        )
+        option_manager.add_option(
+            "--imr_restore_modules",
+            type=int,
+            default=0,
+            parse_from_config=True,
+            help="Unload the modules imported for IMR241 and IMR242 after every N files, keeping only the results. 0 keeps them loaded.",
+        )
+        option_manager.add_option(
+            "--imr_targets",
+            type=str,
+            comma_separated_list=True,
+            default=[],
+            parse_from_config=True,
+            help="Additional environments to check IMR241 and IMR242 against, as NAME=PATH, where PATH is a list of search directories separated by os.pathsep or a Python executable. Imports failing only in a target are reported with its name.",
+        )
 
     @staticmethod
     def parse_options(
@@ -87,47 +216,151 @@ class ImportChecker:
                 getattr(options, f"imr{error}_include"),
                 getattr(options, f"imr{error}_exclude"),
             )
+        ImportChecker.directory_rules = DirectoryRules(
+            os.getcwd(), ImportChecker.targetted_modules
+        )
+        ImportChecker.lazy_modules = set()
+        if options.imr200_import_times and options.imr200_lazy_threshold > 0:
+            try:
+                with open(
+                    options.imr200_import_times, encoding="utf-8"
+                ) as file:
+                    ImportChecker.lazy_modules = _parse_import_times(
+                        file, options.imr200_lazy_threshold
+                    )
+            except (OSError, UnicodeDecodeError) as error:
+                raise flake8.exceptions.ExecutionError(
+                    f"cannot read --imr200_import_times: {error}"
+                ) from error
+        ImportChecker.static_resolver = (
+            StaticResolver(
+                sys.path + [os.getcwd()],
+                options.imr_resolver_threads,
+                options.imr_stub_paths,
+            )
+            if options.imr_static_resolution
+            else None
+        )
+        try:
+            targets = parse_targets(options.imr_targets)
+        except ValueError as error:
+            raise flake8.exceptions.ExecutionError(
+                f"invalid --imr_targets: {error}"
+            ) from error
+        ImportChecker.targets = {
+            name: StaticResolver(
+                target.paths + [os.getcwd()],
+                options.imr_resolver_threads,
+                options.imr_stub_paths,
+                target.extension_suffixes,
+                target.builtin_module_names,
+            )
+            for name, target in targets.items()
+        }
+        ImportChecker.import_fallback = not options.imr_no_import_fallback
+        ImportChecker.restore_modules = options.imr_restore_modules
+        ImportChecker.changed_lines = None
+        if options.imr_diff:
+            try:
+                ImportChecker.changed_lines = ChangedLines.from_git(
+                    options.imr_diff
+                )
+            except ValueError as error:
+                raise flake8.exceptions.ExecutionError(
+                    f"--imr_diff requires a git work tree and valid revisions: {error}"
+                ) from error
+        ImportChecker.resolutions = {}
+        if (
+            ImportChecker.shared_cache is None
+            and options.imr_shared_cache_slots > 0
+            and _runs_in_parallel(options)
+        ):
+            ImportChecker.shared_cache = open_shared_cache(
+                options.imr_shared_cache_slots
+            )
 
     def run(self) -> Iterable[Tuple[int, int, str, type]]:
-        for node in ast.walk(self.tree):
-            if (
-                isinstance(node, ast.ClassDef)
-                or isinstance(node, ast.FunctionDef)
-                or isinstance(node, ast.AsyncFunctionDef)
-            ):
-                yield from _imr200(node, ImportChecker.targetted_modules[200])
-
-            if isinstance(node, ast.Import):
-                if _applies_to(node, ImportChecker.targetted_modules[201]):
-                    yield from _imr201(node)
-                if _applies_to(node, ImportChecker.targetted_modules[202]):
-                    yield from _imr202(node)
-                if _applies_to(node, ImportChecker.targetted_modules[220]):
-                    yield from _imr220(node)
-                if _applies_to(node, ImportChecker.targetted_modules[221]):
-                    yield from _imr221(node)
-                if _applies_to(node, ImportChecker.targetted_modules[222]):
-                    yield from _imr222(node)
-                if _applies_to(node, ImportChecker.targetted_modules[223]):
-                    yield from _imr223(node)
-
-            if isinstance(node, ast.ImportFrom):
-                if _applies_to(node, ImportChecker.targetted_modules[201]):
-                    yield from _imr201(node)
-                if _applies_to(node, ImportChecker.targetted_modules[202]):
-                    yield from _imr202(node)
-                if _applies_to(node, ImportChecker.targetted_modules[240]):
-                    yield from _imr240(node)
-                if _applies_to(node, ImportChecker.targetted_modules[241]):
-                    yield from _imr241(node, self.filename)
-                if _applies_to(node, ImportChecker.targetted_modules[242]):
-                    yield from _imr242(node, self.filename)
-                if _applies_to(node, ImportChecker.targetted_modules[243]):
-                    yield from _imr243(node)
-                if _applies_to(node, ImportChecker.targetted_modules[244]):
-                    yield from _imr244(node)
-                if _applies_to(node, ImportChecker.targetted_modules[245]):
-                    yield from _imr245(node)
+        if self.tree is not None:
+            self.records = collect_imports(self.tree)
+            self.tree = None  # only the compact records are needed from here on
+        records = self.records
+        if ImportChecker.changed_lines is not None:
+            records = ImportChecker.changed_lines.filter(self.filename, records)
+        if ImportChecker.static_resolver is not None:
+            self._prefetch(
+                ImportChecker.static_resolver,
+                records,
+                ImportChecker.resolutions,
+            )
+        for resolver in ImportChecker.targets.values():
+            self._prefetch(resolver, records)
+        try:
+            for record in records:
+                if record.local and _applies_to(record, self.rules[200]):
+                    yield from _imr200(record, ImportChecker.lazy_modules)
+
+                if not record.is_from:
+                    if _applies_to(record, self.rules[201]):
+                        yield from _imr201(record)
+                    if _applies_to(record, self.rules[202]):
+                        yield from _imr202(record)
+                    if _applies_to(record, self.rules[220]):
+                        yield from _imr220(record)
+                    if _applies_to(record, self.rules[221]):
+                        yield from _imr221(record)
+                    if _applies_to(record, self.rules[222]):
+                        yield from _imr222(record)
+                    if _applies_to(record, self.rules[223]):
+                        yield from _imr223(record)
+
+                if record.is_from:
+                    if _applies_to(record, self.rules[201]):
+                        yield from _imr201(record)
+                    if _applies_to(record, self.rules[202]):
+                        yield from _imr202(record)
+                    if _applies_to(record, self.rules[240]):
+                        yield from _imr240(record)
+                    if _applies_to(record, self.rules[241]):
+                        yield from _imr241(record, self.filename, self.archive)
+                    if _applies_to(record, self.rules[242]):
+                        yield from _imr242(record, self.filename, self.archive)
+                    if _applies_to(record, self.rules[243]):
+                        yield from _imr243(record)
+                    if _applies_to(record, self.rules[244]):
+                        yield from _imr244(record)
+                    if _applies_to(record, self.rules[245]):
+                        yield from _imr245(record)
+        finally:
+            if ImportChecker.module_snapshot is not None:
+                ImportChecker.files_since_snapshot += 1
+                if (
+                    ImportChecker.files_since_snapshot
+                    >= ImportChecker.restore_modules
+                ):
+                    restore_modules(ImportChecker.module_snapshot)
+                    ImportChecker.module_snapshot = None
+                    ImportChecker.files_since_snapshot = 0
+
+    def _prefetch(
+        self,
+        resolver: StaticResolver,
+        records: List[ImportRecord],
+        resolved: Container[Tuple[str, str]] = (),
+    ) -> None:
+        """Issues the file system lookups for all from-imports of the file at once, except for the resolved ones."""
+        imports = []
+        for record in records:
+            if record.is_from:
+                module = resolver.absolute_module(
+                    self.filename, record.level, record.module or ""
+                )
+                if module is not None:
+                    imports += [
+                        (module, name)
+                        for name in record.names
+                        if (module, name) not in resolved
+                    ]
+        resolver.prefetch(imports)
 
 
 ERROR_MESSAGES = {
@@ -163,163 +396,284 @@ ERROR_HINTS = {
 }
 
 
-def _error_tuple(error_code: int, node: ast.AST) -> Tuple[int, int, str, type]:
+def _error_tuple(
+    error_code: int, record: ImportRecord, target: Optional[str] = None
+) -> Tuple[int, int, str, type]:
+    """:param target The target environment that the error only occurs in, if any."""
+    target_note = f" (target: {target})" if target is not None else ""
     return (
-        node.lineno,
-        node.col_offset,
-        f"IMR{error_code} {ERROR_MESSAGES[error_code]} (hint: {ERROR_HINTS[error_code]})",
+        record.lineno,
+        record.col_offset,
+        f"IMR{error_code} {ERROR_MESSAGES[error_code]}{target_note} (hint: {ERROR_HINTS[error_code]})",
         ImportChecker,
     )
 
 
+def _runs_in_parallel(options: argparse.Namespace) -> bool:
+    jobs = getattr(options, "jobs", None)
+    if jobs is None:
+        return False
+    if jobs.is_auto:
+        return multiprocessing.cpu_count() > 1
+    return jobs.n_jobs > 1
+
+
+def _imports_submodule(
+    filename: str,
+    level: int,
+    from_: str,
+    import_: str,
+    archive: Optional[ArchiveResolver] = None,
+) -> Optional[bool]:
+    """
+    Like imports_submodule, but caches results by absolute module name, shares them with other worker processes,
+    and asks the static resolver first if it is enabled.
+    Imports of modules inside the given archive are resolved by it alone, without importing anything.
+    """
+    if archive is not None:
+        module = archive.absolute_module(filename, level, from_)
+        if module is None:
+            return None
+        if archive.provides(module):
+            return archive.resolve(module, import_)
+        level, from_ = 0, module
+    module = absolute_module(filename, level, from_, sys.path + [os.getcwd()])
+    if module is None:
+        return _resolve(filename, level, from_, import_)
+    key = (module, import_)
+    if key not in ImportChecker.resolutions:
+        shared_cache = ImportChecker.shared_cache
+        found, result = (
+            shared_cache.get(module, import_)
+            if shared_cache is not None
+            else (False, None)
+        )
+        if not found:
+            result = _resolve(filename, level, from_, import_)
+            if shared_cache is not None:
+                shared_cache.put(module, import_, result)
+        ImportChecker.resolutions[key] = result
+    return ImportChecker.resolutions[key]
+
+
+def _target_results(
+    filename: str,
+    level: int,
+    from_: str,
+    import_: str,
+    archive: Optional[ArchiveResolver] = None,
+) -> Iterable[Tuple[str, Optional[bool]]]:
+    """
+    Resolves an import in each target environment, statically. Yields the target names and the results, which are
+    None where the static resolution is inconclusive; those are not reported.
+    Imports of modules inside the given archive are the same in all targets and yield nothing.
+    """
+    if not ImportChecker.targets:
+        return
+    if archive is not None:
+        module = archive.absolute_module(filename, level, from_)
+        if module is None or archive.provides(module):
+            return
+        level, from_ = 0, module
+    for target, resolver in ImportChecker.targets.items():
+        yield target, resolver.imports_submodule(
+            filename, level, from_, import_
+        )
+
+
+def _resolve(
+    filename: str, level: int, from_: str, import_: str
+) -> Optional[bool]:
+    if ImportChecker.static_resolver is not None:
+        result = ImportChecker.static_resolver.imports_submodule(
+            filename, level, from_, import_
+        )
+        if result is not None or not ImportChecker.import_fallback:
+            return result
+    if ImportChecker.restore_modules and ImportChecker.module_snapshot is None:
+        ImportChecker.module_snapshot = dict(sys.modules)
+    return imports_submodule(filename, level, from_, import_)
+
+
 def _applies_to(
-    node: Union[ast.Import, ast.ImportFrom],
-    incexclude: Tuple[List[str], List[str]],
+    record: ImportRecord,
+    incexclude: Tuple[Pattern[str], Pattern[str]],
 ) -> bool:
-    if isinstance(node, ast.Import):
-        modules = [imp.name for imp in node.names]
-    else:
-        modules = [node.module]
+    modules = record.names if not record.is_from else [record.module]
 
     for module in modules:
         if not module:  # "from ." causes module to be None
             module = ""
-        includes = any(
-            fnmatch.fnmatch(module, target) for target in incexclude[0]
-        )
-        excludes = any(
-            fnmatch.fnmatch(module, target) for target in incexclude[1]
-        )
-        if includes and not excludes:
+        module = os.path.normcase(module)
+        if incexclude[0].match(module) and not incexclude[1].match(module):
             return True
     return False
 
 
+def _parse_import_times(lines: Iterable[str], threshold_ms: float) -> Set[str]:
+    """
+    Returns the modules whose cumulative import time, as reported by `python -X importtime`, is at least threshold_ms.
+    """
+    modules = set()
+    for line in lines:
+        _, _, columns = line.partition("import time:")
+        columns = columns.split("|")
+        if len(columns) != 3 or not columns[1].strip().isdigit():
+            continue
+        if int(columns[1]) >= threshold_ms * 1000:
+            modules.add(columns[2].strip())
+    return modules
+
+
+def _is_lazy_import(record: ImportRecord, lazy_modules: Set[str]) -> bool:
+    """
+    Tests whether a local import loads a module that is known to be expensive to import.
+    Importing a submodule also imports all its parent packages, so those are taken into account as well.
+    """
+    if not record.is_from:
+        modules = record.names
+    elif record.level > 0 or not record.module:
+        return False
+    else:
+        modules = (record.module,)
+    return all(
+        any(
+            ".".join(module.split(".")[:i]) in lazy_modules
+            for i in range(1, module.count(".") + 2)
+        )
+        for module in modules
+    )
+
+
 def _imr200(
-    node: Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef],
-    incexclude: Tuple[List[str], List[str]],
+    record: ImportRecord, lazy_modules: Set[str]
 ) -> Iterable[Tuple[int, int, str, type]]:
     """
     Imports should only happen on module level, not locally.
+    Imports in `if TYPE_CHECKING:` blocks and imports of modules which are expensive to import are allowed.
     """
-    for ancestor in ast.walk(node):
-        if isinstance(ancestor, ast.Import) or isinstance(
-            ancestor, ast.ImportFrom
-        ):
-            if _applies_to(ancestor, incexclude):
-                yield _error_tuple(200, ancestor)
+    if not _is_lazy_import(record, lazy_modules):
+        yield _error_tuple(200, record)
 
 
-def _imr201(
-    node: Union[ast.Import, ast.ImportFrom]
-) -> Iterable[Tuple[int, int, str, type]]:
+def _imr201(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     Alias identifiers defined from as segments should be at least two characters long.
     """
-    for name in node.names:
-        if name.asname and len(name.asname) == 1:
-            yield _error_tuple(201, node)
+    for asname in record.asnames:
+        if asname and len(asname) == 1:
+            yield _error_tuple(201, record)
 
 
-def _imr202(
-    node: Union[ast.Import, ast.ImportFrom]
-) -> Iterable[Tuple[int, int, str, type]]:
+def _imr202(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     Alias identifiers should not have the same name as the imported object.
     """
-    for name in node.names:
-        if name.name == name.asname:
-            yield _error_tuple(202, node)
+    for name, asname in zip(record.names, record.asnames):
+        if name == asname:
+            yield _error_tuple(202, record)
 
 
-def _imr220(node: ast.Import) -> Iterable[Tuple[int, int, str, type]]:
+def _imr220(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     When using the import syntax, if the imported module is a submodule, i.e. not a top level module, an "as" segment should be present.
     """
-    for name in node.names:
-        if "." in name.name and not name.asname:
-            yield _error_tuple(220, node)
+    for name, asname in zip(record.names, record.asnames):
+        if "." in name and not asname:
+            yield _error_tuple(220, record)
             break
 
 
-def _imr221(node: ast.Import) -> Iterable[Tuple[int, int, str, type]]:
+def _imr221(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     When using the import syntax, each import statement should only import one module.
     """
-    if len(node.names) > 1:
-        yield _error_tuple(221, node)
+    if len(record.names) > 1:
+        yield _error_tuple(221, record)
 
 
-def _imr222(node: ast.Import) -> Iterable[Tuple[int, int, str, type]]:
+def _imr222(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     The import syntax should not be used.
     """
-    yield _error_tuple(222, node)
+    yield _error_tuple(222, record)
 
 
-def _imr223(node: ast.Import) -> Iterable[Tuple[int, int, str, type]]:
+def _imr223(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     When using the `import` syntax, do not duplicate module names in the `as` segment.
     """
-    for name in node.names:
-        if name.name.split(".")[-1] == name.asname:
-            yield _error_tuple(223, node)
+    for name, asname in zip(record.names, record.asnames):
+        if name.split(".")[-1] == asname:
+            yield _error_tuple(223, record)
 
 
-def _imr240(node: ast.ImportFrom) -> Iterable[Tuple[int, int, str, type]]:
+def _imr240(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     When using the "from" syntax, the import segment only contains one import.
     """
-    if len(node.names) > 1:
-        yield _error_tuple(240, node)
+    if len(record.names) > 1:
+        yield _error_tuple(240, record)
 
 
 def _imr241(
-    node: ast.ImportFrom, filename: str
+    record: ImportRecord, filename: str, archive: Optional[ArchiveResolver]
 ) -> Iterable[Tuple[int, int, str, type]]:
     """
     When using the "from" syntax, only submodules are imported, not module elements.
     """
-    for name in node.names:
-        if not imports_submodule(
-            filename, node.level, node.module or "", name.name
+    for name in record.names:
+        result = _imports_submodule(
+            filename, record.level, record.module or "", name, archive
+        )
+        if not result:
+            yield _error_tuple(241, record)
+        for target, target_result in _target_results(
+            filename, record.level, record.module or "", name, archive
         ):
-            yield _error_tuple(241, node)
+            if result and target_result is False:
+                yield _error_tuple(241, record, target)
 
 
 def _imr242(
-    node: ast.ImportFrom, filename: str
+    record: ImportRecord, filename: str, archive: Optional[ArchiveResolver]
 ) -> Iterable[Tuple[int, int, str, type]]:
     """
     When using the "from" syntax, only module elements are imported, not submodules.
     """
-    for name in node.names:
-        if imports_submodule(
-            filename, node.level, node.module or "", name.name
+    for name in record.names:
+        result = _imports_submodule(
+            filename, record.level, record.module or "", name, archive
+        )
+        if result:
+            yield _error_tuple(242, record)
+        for target, target_result in _target_results(
+            filename, record.level, record.module or "", name, archive
         ):
-            yield _error_tuple(242, node)
+            if not result and target_result is True:
+                yield _error_tuple(242, record, target)
 
 
-def _imr243(node: ast.ImportFrom) -> Iterable[Tuple[int, int, str, type]]:
+def _imr243(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     When using the "from" syntax, import * should not be used.
     """
-    for name in node.names:
-        if name.name == "*":
-            yield _error_tuple(243, node)
+    for name in record.names:
+        if name == "*":
+            yield _error_tuple(243, record)
             break
 
 
-def _imr244(node: ast.ImportFrom) -> Iterable[Tuple[int, int, str, type]]:
+def _imr244(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     Relative imports should not be used.
     """
-    if node.level != 0:
-        yield _error_tuple(244, node)
+    if record.level != 0:
+        yield _error_tuple(244, record)
 
 
-def _imr245(node: ast.ImportFrom) -> Iterable[Tuple[int, int, str, type]]:
+def _imr245(record: ImportRecord) -> Iterable[Tuple[int, int, str, type]]:
     """
     The "from" syntax should not be used.
     """
-    yield _error_tuple(245, node)
+    yield _error_tuple(245, record)
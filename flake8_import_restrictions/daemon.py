@@ -0,0 +1,223 @@
+import json
+import os
+import urllib.parse
+import urllib.request
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+from flake8_import_restrictions import standalone
+from flake8_import_restrictions.checker import ImportChecker
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+MESSAGE_TYPE_ERROR = 1
+SEVERITY_WARNING = 2
+TEXT_DOCUMENT_SYNC_FULL = 1
+
+
+def serve(reader: BinaryIO, writer: BinaryIO) -> None:
+    """
+    Serves the diagnostics subset of the Language Server Protocol on the given streams until the client exits.
+    Open documents are checked on every change and published as diagnostics. Configuration and all resolver caches
+    stay in memory between checks; saving a file only invalidates what was cached about that file.
+
+    Besides the standard notifications, the request "imr/check" with the parameters {"filename": ..., "text": ...}
+    checks a single file (read from disk if "text" is missing) and returns its diagnostics, for non-editor clients.
+
+    A message that cannot be handled is answered with an error, or logged to the client if it is a notification, and
+    the server keeps running.
+    """
+    server = _Server(writer)
+    while True:
+        try:
+            message = read_message(reader)
+        except ValueError as error:
+            server.send_error(None, PARSE_ERROR, f"Invalid message: {error}")
+            continue
+        if message is None or not server.handle(message):
+            break
+
+
+def read_message(reader: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Reads a single message with Language Server Protocol framing. Returns None at the end of the stream.
+
+    Raises ValueError if the header or the content is malformed. The content of a message with a valid Content-Length
+    is consumed either way, so that reading can continue with the next message.
+    """
+    length = None
+    while True:
+        line = reader.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            if length is None:
+                continue
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+            if length < 0:
+                raise ValueError(f"negative Content-Length {length}")
+    return json.loads(reader.read(length))
+
+
+def write_message(writer: BinaryIO, message: Dict[str, Any]) -> None:
+    body = json.dumps(message).encode("utf-8")
+    writer.write(b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+    writer.flush()
+
+
+class _Server:
+    def __init__(self, writer: BinaryIO):
+        self.writer = writer
+        self.documents: Dict[str, str] = {}
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "initialize": self._initialize,
+            "initialized": lambda params: None,
+            "shutdown": lambda params: None,
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didSave": self._did_save,
+            "textDocument/didClose": self._did_close,
+            "imr/check": self._check,
+        }
+
+    def handle(self, message: Any) -> bool:
+        """Handles a single message. Returns False if the server should exit."""
+        if not isinstance(message, dict):
+            self.send_error(None, INVALID_REQUEST, "Expected a JSON object.")
+            return True
+        method = message.get("method")
+        if method == "exit":
+            return False
+        handler = self.handlers.get(method)
+        if handler is None:
+            if "id" in message:
+                self.send_error(
+                    message["id"],
+                    METHOD_NOT_FOUND,
+                    f"Unsupported method {method}.",
+                )
+            return True
+        try:
+            result = handler(message.get("params") or {})
+        except (KeyError, TypeError) as error:
+            code, text = INVALID_PARAMS, f"Invalid parameters: {error!r}"
+        except Exception as error:  # pylint: disable=broad-except
+            code, text = INTERNAL_ERROR, f"{type(error).__name__}: {error}"
+        else:
+            if "id" in message:
+                self._send(id=message["id"], result=result)
+            return True
+        if "id" in message:
+            self.send_error(message["id"], code, text)
+        else:
+            self._send(
+                method="window/logMessage",
+                params={
+                    "type": MESSAGE_TYPE_ERROR,
+                    "message": f"{method}: {text}",
+                },
+            )
+        return True
+
+    def send_error(self, id_: Any, code: int, text: str) -> None:
+        self._send(id=id_, error={"code": code, "message": text})
+
+    def _send(self, **message: Any) -> None:
+        write_message(self.writer, {"jsonrpc": "2.0", **message})
+
+    def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": TEXT_DOCUMENT_SYNC_FULL,
+                    "save": {"includeText": True},
+                }
+            },
+            "serverInfo": {
+                "name": ImportChecker.name,
+                "version": ImportChecker.version,
+            },
+        }
+
+    def _did_open(self, params: Dict[str, Any]) -> None:
+        document = params["textDocument"]
+        self.documents[document["uri"]] = document["text"]
+        self._publish(document["uri"])
+
+    def _did_change(self, params: Dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        if params["contentChanges"]:
+            self.documents[uri] = params["contentChanges"][-1]["text"]
+        self._publish(uri)
+
+    def _did_save(self, params: Dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        if "text" in params:
+            self.documents[uri] = params["text"]
+        # The saved module may be imported by the other open documents.
+        standalone.invalidate(uri_to_path(uri))
+        for open_uri in self.documents:
+            self._publish(open_uri)
+
+    def _did_close(self, params: Dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self._send(
+            method="textDocument/publishDiagnostics",
+            params={"uri": uri, "diagnostics": []},
+        )
+
+    def _check(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        filename = params["filename"]
+        text = params.get("text")
+        if text is None:
+            text = standalone.read_source(filename)
+            if text is None:
+                raise OSError(f"cannot read {filename}")
+        reports = standalone.check_source(text, filename)
+        return _diagnostics(reports, text)
+
+    def _publish(self, uri: str) -> None:
+        text = self.documents.get(uri, "")
+        reports = standalone.check_source(text, uri_to_path(uri))
+        self._send(
+            method="textDocument/publishDiagnostics",
+            params={"uri": uri, "diagnostics": _diagnostics(reports, text)},
+        )
+
+
+def _diagnostics(
+    reports: List[standalone.Report], text: Optional[str]
+) -> List[Dict[str, Any]]:
+    lines = text.splitlines() if text is not None else []
+    diagnostics = []
+    for _, line, col, message in reports:
+        code, _, description = message.partition(" ")
+        end = len(lines[line - 1].rstrip()) if line <= len(lines) else col - 1
+        diagnostics.append(
+            {
+                "range": {
+                    "start": {"line": line - 1, "character": col - 1},
+                    "end": {"line": line - 1, "character": max(end, col - 1)},
+                },
+                "severity": SEVERITY_WARNING,
+                "code": code,
+                "source": ImportChecker.name,
+                "message": description,
+            }
+        )
+    return diagnostics
+
+
+def uri_to_path(uri: str) -> str:
+    parsed = urllib.parse.urlparse(uri)
+    if parsed.scheme != "file":
+        return uri
+    return os.path.normpath(urllib.request.url2pathname(parsed.path))
@@ -0,0 +1,121 @@
+import configparser
+import fnmatch
+import os
+import re
+from typing import Dict, List, Mapping, Optional, Pattern, Tuple
+
+CONFIG_FILES = ("setup.cfg", "tox.ini", ".flake8")
+SECTION = "flake8-import-restrictions"
+
+# For each error code, the compiled include and exclude patterns.
+CompiledRules = Dict[int, Tuple[Pattern[str], Pattern[str]]]
+
+
+def compile_patterns(patterns: List[str]) -> Pattern[str]:
+    """Compiles a list of UNIX wildcard patterns into a single regular expression that matches if any pattern does."""
+    if not patterns:
+        return re.compile("(?!)")
+    return re.compile(
+        "|".join(
+            fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns
+        )
+    )
+
+
+def compile_rules(
+    targetted_modules: Mapping[int, Tuple[List[str], List[str]]],
+) -> CompiledRules:
+    return {
+        error: (compile_patterns(include), compile_patterns(exclude))
+        for error, (include, exclude) in targetted_modules.items()
+    }
+
+
+class DirectoryRules:
+    """
+    Index from directories to the include and exclude patterns effective for the files in them.
+
+    Every directory below the root may contain one of the CONFIG_FILES with a [flake8-import-restrictions] section
+    that overrides the patterns of its parent directory, e.g. "imr241_exclude = foo.*". Options that are not
+    mentioned are inherited. Each directory is looked up and compiled at most once; afterwards, finding the rules for
+    a file is a single dictionary lookup.
+
+    :param root The directory whose rules are the given base rules, usually the working directory of flake8.
+    :param targetted_modules The include and exclude patterns set through regular flake8 options.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        targetted_modules: Mapping[int, Tuple[List[str], List[str]]],
+    ):
+        self.root = os.path.abspath(root)
+        self.base = dict(targetted_modules)
+        self.base_rules = compile_rules(self.base)
+        self._patterns: Dict[str, Dict[int, Tuple[List[str], List[str]]]] = {}
+        self._rules: Dict[str, CompiledRules] = {}
+
+    def rules_for(self, filename: str) -> CompiledRules:
+        directory = os.path.dirname(os.path.abspath(filename))
+        rules = self._rules.get(directory)
+        if rules is None:
+            patterns = self._patterns_for(directory)
+            rules = (
+                self.base_rules
+                if patterns is self.base
+                else compile_rules(patterns)
+            )
+            self._rules[directory] = rules
+        return rules
+
+    def _patterns_for(
+        self, directory: str
+    ) -> Dict[int, Tuple[List[str], List[str]]]:
+        if directory in self._patterns:
+            return self._patterns[directory]
+        parent = os.path.dirname(directory)
+        if directory == self.root or parent == directory:
+            patterns = self.base
+        elif os.path.commonpath([directory, self.root]) != self.root:
+            patterns = self.base
+        else:
+            patterns = self._patterns_for(parent)
+            overrides = _read_overrides(directory)
+            if overrides:
+                patterns = dict(patterns)
+                for (error, index), values in overrides.items():
+                    include, exclude = patterns.get(error, ([], []))
+                    patterns[error] = (
+                        (values, exclude) if index == 0 else (include, values)
+                    )
+        self._patterns[directory] = patterns
+        return patterns
+
+
+def _read_overrides(
+    directory: str,
+) -> Optional[Dict[Tuple[int, int], List[str]]]:
+    """
+    Reads the pattern overrides of a single directory. The keys of the result are the error code and 0 for include
+    or 1 for exclude patterns.
+    """
+    for config_file in CONFIG_FILES:
+        path = os.path.join(directory, config_file)
+        if not os.path.isfile(path):
+            continue
+        parser = configparser.RawConfigParser()
+        try:
+            parser.read(path, encoding="utf-8")
+        except (configparser.Error, UnicodeDecodeError):
+            continue
+        if not parser.has_section(SECTION):
+            continue
+        overrides = {}
+        for key, value in parser.items(SECTION):
+            match = re.fullmatch(r"imr(\d+)_(include|exclude)", key)
+            if match:
+                overrides[(int(match[1]), int(match[2] == "exclude"))] = [
+                    item for item in re.split(r"[,\s]+", value) if item
+                ]
+        return overrides
+    return None
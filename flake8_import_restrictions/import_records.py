@@ -0,0 +1,144 @@
+import ast
+import functools
+import sys
+from typing import List, Optional, Tuple, Union
+
+# Import statements can only be nested in these nodes, expressions never contain them.
+STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler) + (
+    (ast.match_case,) if hasattr(ast, "match_case") else ()
+)
+
+
+class ImportRecord:
+    """
+    A compact representation of an import statement, holding everything the checks need without keeping the AST alive.
+    All strings are interned, so module names shared by many imports are only stored once.
+
+    :param is_from True for "from" imports (ast.ImportFrom), False for "import" imports (ast.Import).
+    :param module The module in the "from" segment. None for "import" imports and for "from . import x".
+    :param level The number of leading dots of a relative "from" import.
+    :param names The names in the "import" segment.
+    :param asnames The aliases of the names in the "import" segment, or None for names without "as" segment.
+    :param local True if the statement is executed inside a function or class body instead of on module level.
+    """
+
+    __slots__ = (
+        "is_from",
+        "module",
+        "level",
+        "names",
+        "asnames",
+        "lineno",
+        "col_offset",
+        "end_lineno",
+        "local",
+    )
+
+    def __init__(
+        self,
+        is_from: bool,
+        module: Optional[str],
+        level: int,
+        names: Tuple[str, ...],
+        asnames: Tuple[Optional[str], ...],
+        lineno: int,
+        col_offset: int,
+        end_lineno: int,
+        local: bool,
+    ):
+        self.is_from = is_from
+        self.module = module
+        self.level = level
+        self.names = names
+        self.asnames = asnames
+        self.lineno = lineno
+        self.col_offset = col_offset
+        self.end_lineno = end_lineno
+        self.local = local
+
+    @staticmethod
+    def from_node(
+        node: Union[ast.Import, ast.ImportFrom], local: bool
+    ) -> "ImportRecord":
+        is_from = isinstance(node, ast.ImportFrom)
+        return ImportRecord(
+            is_from,
+            _intern(node.module) if is_from else None,
+            node.level if is_from else 0,
+            tuple(sys.intern(alias.name) for alias in node.names),
+            _aliases(node.names),
+            node.lineno,
+            node.col_offset,
+            getattr(node, "end_lineno", None) or node.lineno,
+            local,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ImportRecord) and all(
+            getattr(self, slot) == getattr(other, slot)
+            for slot in ImportRecord.__slots__
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{slot}={getattr(self, slot)!r}" for slot in ImportRecord.__slots__
+        )
+        return f"ImportRecord({fields})"
+
+
+def collect_imports(tree: ast.AST) -> List[ImportRecord]:
+    """
+    Returns records of all import statements in a module, ordered by position.
+    Imports in `if TYPE_CHECKING:` blocks are never executed at runtime and are therefore not considered local.
+    """
+    records = []
+    todo = [(tree, False, False)]
+    while todo:
+        node, in_scope, type_checking = todo.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            records.append(
+                ImportRecord.from_node(node, in_scope and not type_checking)
+            )
+            continue
+        if isinstance(
+            node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+        ):
+            in_scope = True
+        if is_type_checking_block(node):
+            todo += [(child, in_scope, True) for child in node.body]
+            todo += [(child, in_scope, type_checking) for child in node.orelse]
+        else:
+            todo += [
+                (child, in_scope, type_checking)
+                for child in ast.iter_child_nodes(node)
+                if isinstance(child, STATEMENT_CONTAINERS)
+            ]
+    records.sort(key=lambda record: (record.lineno, record.col_offset))
+    return records
+
+
+def is_type_checking_block(node: ast.AST) -> bool:
+    if not isinstance(node, ast.If):
+        return False
+    if isinstance(node.test, ast.Name):
+        return node.test.id == "TYPE_CHECKING"
+    return (
+        isinstance(node.test, ast.Attribute)
+        and node.test.attr == "TYPE_CHECKING"
+    )
+
+
+def _aliases(names: List[ast.alias]) -> Tuple[Optional[str], ...]:
+    if not any(alias.asname for alias in names):
+        return _no_aliases(len(names))
+    return tuple(_intern(alias.asname) for alias in names)
+
+
+@functools.lru_cache(maxsize=None)
+def _no_aliases(length: int) -> Tuple[None, ...]:
+    """Most imports have no aliases, so the tuples are shared between records."""
+    return (None,) * length
+
+
+def _intern(string: Optional[str]) -> Optional[str]:
+    return sys.intern(string) if string is not None else None
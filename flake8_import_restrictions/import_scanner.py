@@ -0,0 +1,248 @@
+import bisect
+import re
+import sys
+from typing import List, Match, Optional, Tuple
+
+from flake8_import_restrictions.import_records import (
+    ImportRecord,
+    _intern,
+    _no_aliases,
+)
+
+# Strings and comments, which are skipped as a whole, and the import keyword, which only occurs in import statements.
+# Every alternative starts with a literal character, which lets the regex engine skip ahead quickly; this is why the
+# import keyword is not preceded by \b, whose check is done separately.
+_STRING = (
+    r'"""(?:[^"\\]+|\\.|"(?!""))*"""'
+    r"|'''(?:[^'\\]+|\\.|'(?!''))*'''"
+    r'|"(?:[^"\\\n]+|\\.)*"'
+    r"|'(?:[^'\\\n]+|\\.)*'"
+)
+_TOKENS = re.compile(
+    rf"(?P<string>{_STRING})|#[^\n]*|(?P<import>import\b)", re.DOTALL
+)
+# Everything on the line of an import keyword before it: the indentation and, for from-imports, the module.
+_PREFIX = re.compile(
+    r"(?P<indent>[ \t]*)"
+    r"(?:from(?![\w])[ \t]*(?P<dots>[. \t]*)(?P<module>[^\W\d]\w*(?:\.[^\W\d]\w*)*)?[ \t]*)?"
+)
+# The names of an import statement, up to the end of the statement.
+_PARENTHESIZED_NAMES = re.compile(r"[ \t]*\((?P<names>(?:[^)#]|#[^\n]*)*)\)")
+_NAMES = re.compile(r"(?P<names>(?:[^\n\\#;]|\\\r?\n)*)")
+_ALIAS = re.compile(
+    r"\s*(?P<name>[^\W\d]\w*(?:\s*\.\s*[^\W\d]\w*)*)(?:\s+as\s+(?P<asname>[^\W\d]\w*))?\s*"
+)
+_WORD = re.compile(r"\w")
+_COMMENT = re.compile(r"#[^\n]*")
+# Block headers that can enclose an import statement.
+_HEADER = re.compile(
+    r"(?:(?P<scope>(?:async[ \t]+)?(?:def|class))"
+    r"|(?P<if>(?:el)?if)"
+    r"|else|try|except|finally|(?:async[ \t]+)?(?:with|for)|while|match|case)(?![\w])"
+)
+# What decides where a block header ends: brackets, colons (but not :=), and line ends outside of strings.
+_HEADER_TOKENS = re.compile(
+    rf"{_STRING}|#[^\n]*|\\\r?\n|[()\[\]{{}}\n]|:(?!=)", re.DOTALL
+)
+_END_OF_LINE = re.compile(r"[ \t]*(?:#[^\n]*)?\r?(?:\n|$)")
+_TYPE_CHECKING = re.compile(
+    r"(?:el)?if[ \t]+(?:[^\W\d]\w*\.)*TYPE_CHECKING[ \t]*:"
+)
+
+
+def scan_imports(source: str) -> Optional[List[ImportRecord]]:
+    """
+    Finds the import statements of a module like collect_imports, but without parsing the module.
+    A single regular expression skips over strings and comments and finds all import keywords. Only the import
+    statements themselves and, for indented ones, the headers of the enclosing blocks are looked at.
+    Returns None if the result might differ from collect_imports, e.g. for imports after a semicolon or a colon on the
+    same line, or for unusual indentation. The caller then has to parse the module.
+    Unlike parsing, this does not detect syntax errors outside of import statements.
+    """
+    if "import" not in source:
+        return []
+    string_starts: List[int] = []
+    string_ends: List[int] = []
+    keywords = []
+    for match in _TOKENS.finditer(source):
+        kind = match.lastgroup
+        if kind == "import":
+            start = match.start()
+            if start == 0 or not _WORD.match(source, start - 1):
+                keywords.append(start)
+        elif kind == "string" and source.find("\n", *match.span()) != -1:
+            string_starts.append(match.start())
+            string_ends.append(match.end())
+    records = []
+    lineno = 1
+    counted = 0
+    for keyword in keywords:
+        start = source.rfind("\n", 0, keyword) + 1
+        prefix = _PREFIX.fullmatch(source, start, keyword)
+        if prefix is None or "\t" in prefix["indent"]:
+            return None
+        if _continues_previous_line(source, start):
+            return None
+        lineno += source.count("\n", counted, start)
+        counted = start
+        record = _record(source, prefix, keyword + len("import"), lineno)
+        if record is None:
+            return None
+        if prefix["indent"]:
+            context = _enclosing_blocks(
+                source, start, len(prefix["indent"]), string_starts, string_ends
+            )
+            if context is None:
+                return None
+            in_scope, type_checking = context
+            record.local = in_scope and not type_checking
+        records.append(record)
+    return records
+
+
+def _continues_previous_line(source: str, start: int) -> bool:
+    end = start - 1
+    if end > 0 and source[end - 1] == "\r":
+        end -= 1
+    return end > 0 and source[end - 1] == "\\"
+
+
+def _record(
+    source: str, prefix: Match, position: int, lineno: int
+) -> Optional[ImportRecord]:
+    is_from = prefix.start("dots") != -1
+    names_match = (
+        _PARENTHESIZED_NAMES.match(source, position) if is_from else None
+    )
+    parenthesized = names_match is not None
+    if names_match is None:
+        names_match = _NAMES.match(source, position)
+    text = _COMMENT.sub("", names_match["names"]).replace("\\\n", " ")
+    aliases = text.split(",")
+    if parenthesized and len(aliases) > 1 and not aliases[-1].strip():
+        aliases.pop()  # trailing comma
+    if is_from and not parenthesized and text.strip() == "*":
+        names: Tuple[str, ...] = ("*",)
+        asnames: Tuple[Optional[str], ...] = (None,)
+    else:
+        names, asnames = (), ()
+        for alias in aliases:
+            match = _ALIAS.fullmatch(alias)
+            if match is None or is_from and "." in match["name"]:
+                return None
+            names += (sys.intern(re.sub(r"\s+", "", match["name"])),)
+            asnames += (match["asname"],)
+    if any(name in ("as", "import", "from") for name in names):
+        return None
+    if is_from:
+        dots = prefix["dots"].replace(" ", "").replace("\t", "")
+        if not dots and prefix["module"] is None:
+            return None
+        level, module = len(dots), prefix["module"]
+    else:
+        level, module = 0, None
+    return ImportRecord(
+        is_from,
+        _intern(module),
+        level,
+        names,
+        (
+            _no_aliases(len(names))
+            if not any(asnames)
+            else tuple(_intern(asname) for asname in asnames)
+        ),
+        lineno,
+        len(prefix["indent"]),
+        lineno + source.count("\n", position, names_match.end()),
+        False,
+    )
+
+
+def _enclosing_blocks(
+    source: str,
+    position: int,
+    indent: int,
+    string_starts: List[int],
+    string_ends: List[int],
+) -> Optional[Tuple[bool, bool]]:
+    """
+    Walks up the blocks enclosing the line starting at the given position, by indentation.
+    Returns whether any of them is a function or class body and whether any is an `if TYPE_CHECKING:` body.
+    """
+    in_scope = type_checking = False
+    while indent > 0:
+        line = _previous_line(
+            source, position, indent, string_starts, string_ends
+        )
+        if line is None:
+            return None
+        position, line_indent, header = line
+        if header[0] in ")]}":
+            # The end of a multi-line header, e.g. of a function signature.
+            line = _previous_line(
+                source, position, line_indent + 1, string_starts, string_ends
+            )
+            if line is None or line[1] != line_indent or line[2][0] in ")]}":
+                return None
+            position, _, header = line
+        match = _HEADER.match(header)
+        if match is None or not _ends_with_colon(source, position):
+            return None
+        if match["scope"]:
+            in_scope = True
+        elif match["if"] and "TYPE_CHECKING" in header:
+            if not _TYPE_CHECKING.match(header):
+                return None
+            type_checking = True
+        indent = line_indent
+    return in_scope, type_checking
+
+
+def _ends_with_colon(source: str, position: int) -> bool:
+    """
+    Checks that the logical line starting at the given position ends with a colon, as block headers do. Lines inside
+    brackets that start like a header, e.g. "else c)" of a conditional expression, close a bracket before that.
+    """
+    depth = 0
+    for match in _HEADER_TOKENS.finditer(source, position):
+        token = match[0]
+        if token in "([{":
+            depth += 1
+        elif token in ")]}":
+            depth -= 1
+            if depth < 0:
+                return False
+        elif token == ":" and depth == 0:
+            return _END_OF_LINE.match(source, match.end()) is not None
+        elif token == "\n" and depth == 0:
+            return False
+    return False
+
+
+def _previous_line(
+    source: str,
+    position: int,
+    indent: int,
+    string_starts: List[int],
+    string_ends: List[int],
+) -> Optional[Tuple[int, int, str]]:
+    """
+    Finds the closest line before the given position that contains code and is indented less than the given indent.
+    Returns its position, its indentation, and its content without indentation.
+    """
+    while position > 0:
+        end = position - 1
+        position = source.rfind("\n", 0, end) + 1
+        line = source[position:end]
+        content = line.lstrip(" \t")
+        if not content.strip() or content[0] == "#":
+            continue
+        index = bisect.bisect_right(string_starts, position - 1) - 1
+        if index >= 0 and string_ends[index] > position:
+            continue  # inside a multi-line string
+        line_indent = len(line) - len(content)
+        if "\t" in line[:line_indent]:
+            return None
+        if line_indent < indent:
+            return position, line_indent, content
+    return None
@@ -1,8 +1,12 @@
+import gc
 import importlib
+import importlib.machinery
+import importlib.util
 import os.path
 import sys
 import types
-from typing import Optional
+import weakref
+from typing import Dict, Optional, Sequence, Tuple
 
 
 def imports_submodule(
@@ -21,7 +25,7 @@ def imports_submodule(
     """
     old_sys_path = sys.path
     try:
-        sys.path += [os.getcwd()]
+        sys.path = sys.path + [os.getcwd()]
         if level > 0:
             try:
                 filename = os.path.dirname(_rel_to_sys_path(filename))
@@ -33,9 +37,15 @@ def imports_submodule(
 
         try:
             parent = importlib.import_module("." * level + from_, package)
-        except (ImportError, TypeError):
+        except Exception:  # pylint: disable=broad-except
+            # Besides ImportErrors, executing a module may fail in arbitrary ways, e.g. in C extensions.
             return None
-        if not hasattr(parent, import_):
+        try:
+            has_attribute = hasattr(parent, import_)
+        except Exception:  # pylint: disable=broad-except
+            # A module level __getattr__ may fail in arbitrary ways as well.
+            return None
+        if not has_attribute:
             try:
                 importlib.import_module(
                     "." * level + (from_ + "." if from_ else "") + import_,
@@ -46,16 +56,108 @@ def imports_submodule(
             except ValueError:  # only relevant for Python 3.8
                 if sys.version_info[1] <= 8:
                     return False
-                else:
-                    raise
-        return isinstance(getattr(parent, import_), types.ModuleType)
+                # Otherwise raised while executing the module.
+                return None
+            except Exception:  # pylint: disable=broad-except
+                return None
+        try:
+            return isinstance(getattr(parent, import_), types.ModuleType)
+        except Exception:  # pylint: disable=broad-except
+            return None
     finally:
         sys.path = old_sys_path
 
 
-def _rel_to_sys_path(path: str) -> str:
+def restore_modules(snapshot: Dict[str, types.ModuleType]) -> int:
+    """
+    Restores sys.modules to the given copy, so that the modules imported since then can be garbage collected.
+    Their bindings as attributes of their parent packages are removed as well. Modules that are still referenced
+    elsewhere afterwards, e.g. through atexit handlers or caches of other modules, would not be freed but imported
+    a second time later on, so they are put back. Extension modules are always kept, since they are never unloaded
+    and may not support being initialized twice.
+
+    :return The number of unloaded modules.
+    """
+    removed = {}
+    for name, module in list(sys.modules.items()):
+        if snapshot.get(name) is module or _is_extension(module):
+            continue
+        removed[name] = module
+        del sys.modules[name]
+    for name, module in snapshot.items():
+        sys.modules.setdefault(name, module)
+    for name, module in removed.items():
+        parent_module, child = _parent(name)
+        if parent_module is not None and (
+            getattr(parent_module, "__dict__", {}).get(child) is module
+        ):
+            delattr(parent_module, child)
+    if not removed:
+        return 0
+    references = {}
+    for name, module in removed.items():
+        try:
+            references[name] = weakref.ref(module)
+        except TypeError:
+            # not a module, e.g. an object replacing itself in sys.modules
+            references[name] = lambda module=module: module
+    del module
+    removed.clear()
+    gc.collect()
+    unloaded = 0
+    for name, reference in references.items():
+        module = reference()
+        if module is None:
+            unloaded += 1
+            continue
+        sys.modules[name] = module
+        parent_module, child = _parent(name)
+        if parent_module is not None:
+            setattr(parent_module, child, module)
+    return unloaded
+
+
+def _parent(name: str) -> Tuple[Optional[types.ModuleType], str]:
+    parent, _, child = name.rpartition(".")
+    return sys.modules.get(parent), child
+
+
+def _is_extension(module: types.ModuleType) -> bool:
+    loader = getattr(getattr(module, "__spec__", None), "loader", None)
+    return isinstance(loader, importlib.machinery.ExtensionFileLoader)
+
+
+def absolute_module(
+    filename: str,
+    level: int,
+    from_: str,
+    search_paths: Optional[Sequence[str]] = None,
+) -> Optional[str]:
+    """
+    Returns the absolute name of the module in the "from" segment of a (possibly relative) import statement, or None
+    if it cannot be determined.
+
+    :param search_paths The directories that the package of a relative import is determined from. Defaults to sys.path.
+    """
+    if level == 0:
+        return from_
+    rel_path = _rel_to_sys_path(filename, search_paths)
+    if rel_path is None:
+        return None
+    package = ".".join(os.path.dirname(rel_path).split(os.path.sep))
+    if not package:
+        return None
+    try:
+        return importlib.util.resolve_name("." * level + from_, package)
+    except (ImportError, ValueError):
+        return None
+
+
+def _rel_to_sys_path(
+    path: str, search_paths: Optional[Sequence[str]] = None
+) -> str:
     """Given an arbitrary filename, returns the equivalent relative path from the sys.path-directory it is contained in."""
-    for include in sys.path:
+    for include in sys.path if search_paths is None else search_paths:
         path_abs = os.path.abspath(path)
         include_abs = os.path.realpath(os.path.abspath(include))
         try:
@@ -0,0 +1,224 @@
+import argparse
+import hashlib
+import heapq
+import importlib.machinery
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+FORMAT_VERSION = 1
+
+
+class ShardResults:
+    """
+    The outcome of checking one shard of the files, in a form that can be merged with the outcomes of other shards.
+    A merged outcome without reports is the cache of the next run: its costs weight the files when partitioning them,
+    and its resolutions warm up ImportChecker.resolutions.
+
+    :param reports The errors found, ordered by file.
+    :param costs The seconds spent checking each file.
+    :param resolutions The results of resolving "from module import name" statements, by (module, name). Only modules
+    outside of the working directory are kept, since the project's own modules may change until the next run.
+    :param environment Identifies the interpreter and search path that the resolutions are valid for.
+    """
+
+    def __init__(
+        self,
+        reports: List[Tuple[str, int, int, str]],
+        costs: Dict[str, float],
+        resolutions: Dict[Tuple[str, str], Optional[bool]],
+        environment: str,
+    ):
+        self.reports = reports
+        self.costs = costs
+        self.resolutions = resolutions
+        self.environment = environment
+
+    @staticmethod
+    def load(path: str) -> "ShardResults":
+        """Reads results written by save(). Raises OSError or ValueError if the file is missing or invalid."""
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a results file of this version")
+        try:
+            return ShardResults(
+                [
+                    (str(filename), int(line), int(col), str(message))
+                    for filename, line, col, message in data["reports"]
+                ],
+                {
+                    str(filename): float(cost)
+                    for filename, cost in data["costs"].items()
+                },
+                {
+                    (str(module), str(name)): result
+                    for module, name, result in data["resolutions"]
+                },
+                str(data["environment"]),
+            )
+        except (KeyError, TypeError, AttributeError) as error:
+            raise ValueError(f"{path} is malformed: {error!r}") from error
+
+    def save(self, path: str) -> None:
+        """Writes the results as JSON, with a stable order so that equal results produce equal files."""
+        data = {
+            "version": FORMAT_VERSION,
+            "environment": self.environment,
+            "reports": sorted(self.reports),
+            "costs": dict(sorted(self.costs.items())),
+            "resolutions": [
+                [module, name, result]
+                for (module, name), result in sorted(self.resolutions.items())
+            ],
+        }
+        temporary = path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=1)
+        os.replace(temporary, path)
+
+    @staticmethod
+    def merge(results: Sequence["ShardResults"]) -> "ShardResults":
+        """
+        Combines the results of several shards. Resolutions are only kept if all shards ran in the same environment,
+        and resolutions that the shards disagree on are dropped.
+        """
+        environments = {result.environment for result in results}
+        shared = environments.pop() if len(environments) == 1 else ""
+        merged = ShardResults([], {}, {}, shared)
+        conflicts = set()
+        for result in results:
+            merged.reports += result.reports
+            merged.costs.update(result.costs)
+            if not shared:
+                continue
+            for key, resolution in result.resolutions.items():
+                if merged.resolutions.setdefault(key, resolution) != resolution:
+                    conflicts.add(key)
+        for key in conflicts:
+            del merged.resolutions[key]
+        merged.reports.sort()
+        return merged
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parses "INDEX/COUNT" with a 1-based index, e.g. "2/8", for argparse."""
+    index, _, count = value.partition("/")
+    try:
+        shard = int(index), int(count)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(
+            f"expected INDEX/COUNT, e.g. 1/4, got {value!r}"
+        ) from error
+    if not 1 <= shard[0] <= shard[1]:
+        raise argparse.ArgumentTypeError(
+            f"shard index must be between 1 and the shard count, got {value!r}"
+        )
+    return shard
+
+
+def partition(
+    filenames: Iterable[str], count: int, costs: Dict[str, float]
+) -> List[List[str]]:
+    """
+    Splits the files into the given number of shards of about equal total cost. Every node computing the partition
+    from the same files and costs gets the same shards, independent of the order of the files.
+
+    Files checked before cost their measured seconds, all other files are estimated from their size, using the seconds
+    per byte of the measured files. Files are assigned from the most to the least expensive, each to the shard with
+    the lowest total cost so far.
+
+    :return The files of each shard, sorted.
+    """
+    weights = _weights(sorted(set(filenames)), costs)
+    shards: List[List[str]] = [[] for _ in range(count)]
+    totals = [(0.0, index) for index in range(count)]
+    for filename, weight in sorted(
+        weights.items(), key=lambda item: (-item[1], item[0])
+    ):
+        total, index = heapq.heappop(totals)
+        shards[index].append(filename)
+        heapq.heappush(totals, (total + weight, index))
+    for shard in shards:
+        shard.sort()
+    return shards
+
+
+def environment() -> str:
+    """Identifies the interpreter and the parts of sys.path outside of the working directory."""
+    paths = [
+        path for path in sys.path if path and not _in_working_directory(path)
+    ]
+    return hashlib.sha256(
+        json.dumps([sys.version, sys.platform, paths]).encode("utf-8")
+    ).hexdigest()
+
+
+def cacheable_resolutions(
+    resolutions: Dict[Tuple[str, str], Optional[bool]],
+) -> Dict[Tuple[str, str], Optional[bool]]:
+    """Returns the resolutions of modules that are not part of the working directory."""
+    outside: Dict[str, bool] = {}
+    cacheable = {}
+    for (module, name), result in resolutions.items():
+        top_level = module.partition(".")[0]
+        if top_level not in outside:
+            outside[top_level] = _installed_outside_working_directory(top_level)
+        if outside[top_level]:
+            cacheable[(module, name)] = result
+    return cacheable
+
+
+def _weights(filenames: List[str], costs: Dict[str, float]) -> Dict[str, float]:
+    sizes = {filename: _size(filename) for filename in filenames}
+    measured = [filename for filename in filenames if filename in costs]
+    measured_bytes = sum(sizes[filename] for filename in measured)
+    measured_seconds = sum(costs[filename] for filename in measured)
+    seconds_per_byte = (
+        measured_seconds / measured_bytes
+        if measured_bytes and measured_seconds
+        else 1.0
+    )
+    return {
+        filename: (
+            costs[filename]
+            if filename in costs
+            else sizes[filename] * seconds_per_byte
+        )
+        for filename in filenames
+    }
+
+
+def _size(filename: str) -> int:
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return 0
+
+
+def _installed_outside_working_directory(top_level: str) -> bool:
+    """Modules that are not found at all are not installed, but may be added to the project later on."""
+    if top_level in sys.builtin_module_names:
+        return True
+    try:
+        spec = importlib.machinery.PathFinder.find_spec(
+            top_level, sys.path + [os.getcwd()]
+        )
+    except (ImportError, ValueError):
+        return False
+    if spec is None:
+        return False
+    locations = list(spec.submodule_search_locations or [])
+    if spec.origin:
+        locations.append(spec.origin)
+    return not any(_in_working_directory(location) for location in locations)
+
+
+def _in_working_directory(path: str) -> bool:
+    cwd = os.path.realpath(os.getcwd())
+    path = os.path.realpath(os.path.abspath(path))
+    try:
+        return os.path.commonpath([path, cwd]) == cwd
+    except ValueError:  # Can happen on Windows systems.
+        return False
@@ -0,0 +1,134 @@
+import atexit
+import hashlib
+import json
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterator, Optional, Tuple
+
+ENVIRONMENT_VARIABLE = "FLAKE8_IMPORT_RESTRICTIONS_SHARED_CACHE"
+MAX_PROBES = 16
+EMPTY = 0
+# Encoding of the results of imports_submodule in the lowest byte of a slot.
+VALUES = {False: 1, True: 2, None: 3}
+RESULTS = {value: result for result, value in VALUES.items()}
+
+
+class SharedResolutionCache:
+    """
+    A fixed size hash table in shared memory that maps (module, name) pairs to the results of imports_submodule, so
+    that flake8 worker processes resolve each pair only once per run.
+
+    Every slot is a single 64 bit word holding 56 bits of the key hash and 8 bits of the value. Slots are only ever
+    written with a single aligned 64 bit store, so readers never observe a key with the value of another key. Two
+    workers publishing into the same slot at the same time only cost a cache miss later. Colliding keys are resolved
+    by linear probing; if no free slot is found, the result is simply not published.
+
+    :param name The name of an existing shared memory block to attach to. A new block is created if this is None.
+    :param slots The number of slots of a newly created table.
+    """
+
+    def __init__(self, name: Optional[str] = None, slots: int = 65536):
+        if name is None:
+            self.memory = shared_memory.SharedMemory(
+                create=True, size=slots * 8
+            )
+            self.owner = True
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+            self.owner = False
+            if sys.version_info < (3, 13):
+                # Before Python 3.13, attaching processes register the block as well and unlink it when they exit.
+                resource_tracker.unregister(
+                    self.memory._name,  # pylint: disable=protected-access
+                    "shared_memory",
+                )
+        self.table = self.memory.buf.cast("Q")
+        self.closed = False
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def get(self, module: str, name: str) -> Tuple[bool, Optional[bool]]:
+        """Returns whether a result for the pair was published and, if so, the result."""
+        key = _hash(module, name)
+        for slot in self._probe(key):
+            word = self.table[slot]
+            if word == EMPTY:
+                break
+            if word >> 8 == key:
+                return True, RESULTS.get(word & 0xFF)
+        return False, None
+
+    def put(self, module: str, name: str, result: Optional[bool]) -> None:
+        key = _hash(module, name)
+        for slot in self._probe(key):
+            word = self.table[slot]
+            if word == EMPTY or word >> 8 == key:
+                self.table[slot] = key << 8 | VALUES[result]
+                return
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.table.release()
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+    def _probe(self, key: int) -> Iterator[int]:
+        start = key % len(self.table)
+        return (
+            (start + i) % len(self.table)
+            for i in range(min(MAX_PROBES, len(self.table)))
+        )
+
+
+def _hash(module: str, name: str) -> int:
+    digest = hashlib.blake2b(
+        f"{module}\0{name}".encode(), digest_size=7
+    ).digest()
+    # A key of zero would be indistinguishable from an empty slot.
+    return int.from_bytes(digest, "little") or 1
+
+
+def open_shared_cache(slots: int) -> Optional[SharedResolutionCache]:
+    """
+    Attaches to the table of the flake8 process that spawned this one, or creates a new table otherwise.
+    The name of a created table is passed on to worker processes via an environment variable; with the "fork" start
+    method, workers inherit the table directly instead. Returns None if shared memory is not available.
+
+    Resolutions are only valid for the working directory and search path they were computed with. The variable
+    therefore carries both, so that unrelated flake8 runs started from this one, e.g. by a pre-commit hook in another
+    project, create their own table. The variable is removed again at exit.
+    """
+    value = os.environ.get(ENVIRONMENT_VARIABLE, "")
+    name, _, scope = value.partition(":")
+    if name and scope == _scope():
+        try:
+            return SharedResolutionCache(name)
+        except (OSError, ValueError):
+            pass
+    try:
+        cache = SharedResolutionCache(slots=slots)
+    except OSError:
+        return None
+    value = f"{cache.name}:{_scope()}"
+    os.environ[ENVIRONMENT_VARIABLE] = value
+    atexit.register(_close, cache, value)
+    return cache
+
+
+def _scope() -> str:
+    """Identifies the working directory and search path that resolutions depend on."""
+    return hashlib.blake2b(
+        json.dumps([os.getcwd(), sys.path]).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _close(cache: SharedResolutionCache, value: str) -> None:
+    if os.environ.get(ENVIRONMENT_VARIABLE) == value:
+        del os.environ[ENVIRONMENT_VARIABLE]
+    cache.close()
@@ -0,0 +1,284 @@
+import argparse
+import ast
+import configparser
+import importlib
+import os
+import re
+import sys
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import flake8.exceptions
+
+from flake8_import_restrictions.archives import (
+    ARCHIVE_ERRORS,
+    Archive,
+    ArchiveResolver,
+)
+from flake8_import_restrictions.checker import ImportChecker
+from flake8_import_restrictions.directory_config import (
+    CONFIG_FILES,
+    DirectoryRules,
+)
+from flake8_import_restrictions.import_records import ImportRecord
+from flake8_import_restrictions.import_scanner import scan_imports
+from flake8_import_restrictions.imports_submodule import _rel_to_sys_path
+from flake8_import_restrictions.sharding import parse_shard
+
+# A reported error: filename, line, column (1-based), and message.
+Report = Tuple[str, int, int, str]
+
+
+class _OptionManager:
+    """
+    Offers the part of flake8's OptionManager interface that ImportChecker.add_options uses, on top of argparse.
+    Options marked with parse_from_config are also read from the [flake8] section of the configuration files in the
+    working directory, like flake8 does.
+    """
+
+    def __init__(self, parser: argparse.ArgumentParser):
+        self.parser = parser
+        self.config_options: List[argparse.Action] = []
+
+    def add_option(
+        self,
+        *args: str,
+        parse_from_config: bool = False,
+        comma_separated_list: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        if comma_separated_list:
+            kwargs["type"] = _comma_separated_list
+        action = self.parser.add_argument(*args, **kwargs)
+        if parse_from_config:
+            self.config_options.append(action)
+
+    def load_config(self, directory: str) -> None:
+        parser = configparser.RawConfigParser()
+        for config_file in CONFIG_FILES:
+            path = os.path.join(directory, config_file)
+            if os.path.isfile(path):
+                parser.read(path, encoding="utf-8")
+                if parser.has_section("flake8"):
+                    break
+        if not parser.has_section("flake8"):
+            return
+        defaults = {}
+        for action in self.config_options:
+            for key in (action.dest, action.dest.replace("_", "-")):
+                if parser.has_option("flake8", key):
+                    value = parser.get("flake8", key)
+                    if action.nargs == 0:  # store_true
+                        defaults[action.dest] = value.strip().lower() in (
+                            "1",
+                            "true",
+                            "yes",
+                            "on",
+                        )
+                    else:
+                        defaults[action.dest] = (action.type or str)(value)
+        self.parser.set_defaults(**defaults)
+
+
+def _comma_separated_list(value: str) -> List[str]:
+    return [item for item in re.split(r"[,\s]+", value) if item]
+
+
+def create_parser() -> Tuple[argparse.ArgumentParser, _OptionManager]:
+    parser = argparse.ArgumentParser(
+        prog="python -m flake8_import_restrictions",
+        description="Checks import statements without running flake8 as a whole.",
+    )
+    parser.add_argument(
+        "paths", nargs="*", default=["."], help="Files or directories to check."
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run as a language server on stdin/stdout, keeping configuration and caches warm between checks.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-check files affected by changes.",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=0.5,
+        help="Seconds between two polls for changes in --watch mode.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="INDEX/COUNT",
+        help="Only check the INDEX-th of COUNT shards of the files, e.g. 2/8. Shards are weighted by file size and by "
+        "the costs in --cache.",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="The cache of the previous run, as written by --merge. Its costs weight the shards, and its resolutions "
+        "are reused if the interpreter and search path are unchanged.",
+    )
+    parser.add_argument(
+        "--results",
+        metavar="FILE",
+        help="Write the reports, per-file costs, and resolutions of this run to FILE, for --merge.",
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        metavar="FILE",
+        help="Instead of checking files, combine the --results files of all shards into a single report, and write "
+        "the consolidated --cache for the next run.",
+    )
+    option_manager = _OptionManager(parser)
+    ImportChecker.add_options(option_manager)
+    return parser, option_manager
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parses the command line and configures ImportChecker accordingly."""
+    parser, option_manager = create_parser()
+    option_manager.load_config(os.getcwd())
+    options = parser.parse_args(argv)
+    try:
+        ImportChecker.parse_options(None, options, [])
+    except flake8.exceptions.ExecutionError as error:
+        parser.error(str(error))
+    return options
+
+
+def check(
+    source: str, filename: str, archive: Optional[ArchiveResolver] = None
+) -> Tuple[List[Report], List[ImportRecord]]:
+    """
+    Runs all checks on the given source code, which is reported as coming from the given file.
+    Also returns the imports found in the source.
+
+    :param archive The archive containing the file, if any.
+    """
+    records = scan_imports(source)
+    if records is None:
+        try:
+            tree = ast.parse(source, filename)
+        except (SyntaxError, ValueError):
+            return [], []
+        checker = ImportChecker(tree, filename)
+    else:
+        checker = ImportChecker(None, filename)
+        checker.records = records
+    checker.archive = archive
+    reports = [
+        (filename, line, col + 1, message)
+        for line, col, message, _ in checker.run()
+    ]
+    return reports, checker.records
+
+
+def check_source(source: str, filename: str) -> List[Report]:
+    return check(source, filename)[0]
+
+
+def read_source(filename: str) -> Optional[str]:
+    try:
+        with open(filename, "rb") as file:
+            return file.read().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def check_file(filename: str) -> List[Report]:
+    source = read_source(filename)
+    return check_source(source, filename) if source is not None else []
+
+
+def check_archive(path: str) -> List[Report]:
+    """
+    Checks all Python files in a wheel, sdist, zipapp, or other zip or tar archive without extracting it.
+    Files are reported as paths inside the archive, e.g. "dist/foo.whl/foo/__init__.py". An archive that cannot be
+    read is reported as E902, like files that flake8 cannot read.
+    """
+    try:
+        archive = Archive(path)
+    except ARCHIVE_ERRORS as error:
+        return [(path, 1, 1, f"E902 {type(error).__name__}: {error}")]
+    resolver = ArchiveResolver(archive, ImportChecker.static_resolver)
+    reports = []
+    for member, content in sorted(archive.sources.items()):
+        if not member.endswith(".py"):
+            continue
+        try:
+            source = content.decode("utf-8")
+        except UnicodeDecodeError:
+            continue
+        filename = os.path.join(path, *member.split("/"))
+        reports += check(source, filename, resolver)[0]
+    return reports
+
+
+def iter_python_files(paths: Iterable[str]) -> Iterable[str]:
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, subdirectories, filenames in os.walk(path):
+                subdirectories[:] = sorted(
+                    subdirectory
+                    for subdirectory in subdirectories
+                    if not subdirectory.startswith(".")
+                )
+                for filename in sorted(filenames):
+                    if filename.endswith(".py"):
+                        yield os.path.join(directory, filename)
+        else:
+            yield path
+
+
+def format_report(report: Report) -> str:
+    return "{}:{}:{}: {}".format(*report)
+
+
+def module_name(filename: str) -> Optional[str]:
+    """Returns the name under which the given file can be imported, or None if it is not on the search path."""
+    rel_path = _rel_to_sys_path(filename, sys.path + [os.getcwd()])
+    if rel_path is None or os.path.isabs(rel_path):
+        return None
+    parts = os.path.splitext(rel_path)[0].split(os.path.sep)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts) or None
+
+
+def invalidate(filename: str) -> None:
+    """
+    Drops everything cached about the given file after it was created, changed, or deleted, so that following checks
+    see its current state.
+    """
+    if os.path.basename(filename) in CONFIG_FILES:
+        rules = ImportChecker.directory_rules
+        if rules is not None:
+            ImportChecker.directory_rules = DirectoryRules(
+                rules.root, rules.base
+            )
+    if ImportChecker.static_resolver is not None:
+        ImportChecker.static_resolver.invalidate(filename)
+    for resolver in ImportChecker.targets.values():
+        resolver.invalidate(filename)
+    importlib.invalidate_caches()
+    module = module_name(filename)
+    if module is None:
+        return
+    parent, _, name = module.rpartition(".")
+    ImportChecker.resolutions = {
+        key: result
+        for key, result in ImportChecker.resolutions.items()
+        if key != (parent, name)
+        and key[0] != module
+        and not key[0].startswith(module + ".")
+    }
+    old_module = sys.modules.pop(module, None)
+    parent_module = sys.modules.get(parent)
+    if (
+        old_module is not None
+        and getattr(parent_module, name, None) is old_module
+    ):
+        delattr(parent_module, name)
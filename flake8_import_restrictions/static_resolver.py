@@ -0,0 +1,668 @@
+import ast
+import concurrent.futures
+import functools
+import importlib.machinery
+import importlib.util
+import os
+import re
+import stat
+import sys
+from collections import defaultdict
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from flake8_import_restrictions.imports_submodule import absolute_module
+
+SOURCE_SUFFIXES = importlib.machinery.SOURCE_SUFFIXES
+# The file name of an extension module for any Python version and platform, e.g. "foo.cpython-38-x86_64-linux-gnu.so".
+EXTENSION_FILE = re.compile(r"([^.]+)(?:\.[^.]+)?\.(?:so|pyd)")
+STUB_SUFFIXES = [".pyi"]
+# Locations of typeshed's standard library stubs bundled with type checkers, relative to their package.
+TYPESHED_LOCATIONS = {
+    "mypy": ("typeshed", "stdlib"),
+    "jedi": ("third_party", "typeshed", "stdlib"),
+}
+STANDARD_FINDERS = (
+    importlib.machinery.BuiltinImporter,
+    importlib.machinery.FrozenImporter,
+    importlib.machinery.PathFinder,
+)
+DYNAMIC_NAMES = {"__getattr__", "globals", "vars", "setattr", "__dict__"}
+IMPORT_CALLS = {"import_module", "__import__", "getattr", "reload"}
+MAX_DEPTH = 8
+
+# A binding of a name in a module namespace. One of
+#   ("attribute",): bound to something that is not a module, e.g. a function.
+#   ("module",): bound to a module by an "import" statement.
+#   ("from", level, module, name): bound by a "from" import.
+#   ("unknown",): bound to something that cannot be determined statically.
+_Binding = Tuple
+ATTRIBUTE: _Binding = ("attribute",)
+MODULE: _Binding = ("module",)
+UNKNOWN: _Binding = ("unknown",)
+
+# The origin file of a module and, for packages, the directories containing its submodules.
+_Spec = Tuple[Optional[str], Optional[List[str]]]
+
+
+class StaticResolver:
+    """
+    Answers the same question as imports_submodule, but without importing any module.
+    Instead, module locations are looked up in the file system and module namespaces are approximated from their
+    source code. Whenever this is not possible with certainty, None is returned and the caller has to fall back to
+    imports_submodule.
+    For modules without source code, e.g. extension modules or modules that are not installed at all, stub files are
+    consulted instead, following the order of PEP 561: stub_paths, stub-only packages, inline stubs, and finally the
+    standard library stubs of typeshed if a type checker bundling them is installed.
+
+    :param search_paths The directories to look up top level modules in, usually sys.path.
+    :param max_workers The number of threads used to list directories concurrently in prefetch().
+    :param stub_paths Additional directories containing stub files, such as a checkout of typeshed's stdlib folder.
+    :param extension_suffixes The file name suffixes of extension modules, by default those of the running interpreter.
+    None if they are unknown, e.g. for the site-packages directory of another interpreter. Extension modules built for
+    any Python version and platform are then recognized.
+    :param builtin_module_names The modules compiled into the interpreter, by default those of the running one.
+    """
+
+    def __init__(
+        self,
+        search_paths: Sequence[str],
+        max_workers: int = 8,
+        stub_paths: Sequence[str] = (),
+        extension_suffixes: Optional[Sequence[str]] = tuple(
+            importlib.machinery.EXTENSION_SUFFIXES
+        ),
+        builtin_module_names: Collection[str] = sys.builtin_module_names,
+    ):
+        self.search_paths = [os.path.abspath(path) for path in search_paths]
+        self.max_workers = max_workers
+        self.stub_paths = [os.path.abspath(path) for path in stub_paths]
+        self.any_extension = extension_suffixes is None
+        # In the order in which importlib.machinery.FileFinder looks for them.
+        self.module_suffixes = (
+            list(extension_suffixes or ())
+            + importlib.machinery.SOURCE_SUFFIXES
+            + importlib.machinery.BYTECODE_SUFFIXES
+        )
+        self.builtin_module_names = builtin_module_names
+        self._typeshed_paths: Optional[List[str]] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._roots: Dict[str, Optional[int]] = {}
+        self._claimed: Dict[str, bool] = {}
+        self._listings: Dict[str, Optional[Dict[str, int]]] = {}
+        self._extensions: Dict[str, Dict[str, str]] = {}
+        self._specs: Dict[str, Optional[_Spec]] = {}
+        self._stub_specs: Dict[str, Optional[_Spec]] = {}
+        self._bindings: Dict[str, Optional[Tuple[Dict[str, list], bool]]] = {}
+        self._results: Dict[Tuple[str, str], Optional[bool]] = {}
+
+    def imports_submodule(
+        self, filename: str, level: int, from_: str, import_: str
+    ) -> Optional[bool]:
+        """
+        Same as imports_submodule.imports_submodule, except that None is also returned if the result cannot be
+        determined statically.
+        """
+        module = self.absolute_module(filename, level, from_)
+        if module is None:
+            return None
+        return self.resolve(module, import_)
+
+    def absolute_module(
+        self, filename: str, level: int, from_: str
+    ) -> Optional[str]:
+        """Returns the absolute name of the module in the "from" segment of a (possibly relative) import."""
+        return absolute_module(filename, level, from_, self.search_paths)
+
+    def resolve(
+        self, module: str, import_: str, depth: int = 0
+    ) -> Optional[bool]:
+        """Tests whether "from module import import_" imports a module. The module name must be absolute."""
+        key = (module, import_)
+        if key not in self._results:
+            self._results[key] = None  # guards against import cycles
+            self._results[key] = self._resolve(module, import_, depth)
+        return self._results[key]
+
+    def prefetch(self, imports: Iterable[Tuple[str, str]]) -> None:
+        """
+        Looks up the file system entries required to resolve the given (absolute module, name) pairs.
+        The directory listings of each nesting level are fetched concurrently, so that resolve() does not serialize
+        on file system latency afterwards.
+        """
+        pending = [
+            (f"{module}.{name}".strip(".").split("."), self.search_paths)
+            for module, name in imports
+        ]
+        while pending:
+            self._prefetch_directories(
+                {
+                    directory
+                    for _, directories in pending
+                    for directory in directories
+                }
+            )
+            # The contents of candidate packages are needed to check for __init__ files.
+            self._prefetch_directories(
+                {
+                    os.path.join(directory, parts[0])
+                    for parts, directories in pending
+                    for directory in directories
+                    if self._kind(os.path.join(directory, parts[0]))
+                    == stat.S_IFDIR
+                }
+            )
+            next_pending = []
+            for parts, directories in pending:
+                if len(parts) > 1:
+                    spec = self._find_in(parts[0], directories)
+                    if spec is not None and spec[1] is not None:
+                        next_pending.append((parts[1:], spec[1]))
+            pending = next_pending
+
+    def invalidate(self, path: str) -> None:
+        """Forgets everything derived from the given file or directory, after it was created, changed, or deleted."""
+        path = os.path.abspath(path)
+        # The directory of the file may be new as well, which changes the listing of its parent.
+        for directory in (
+            os.path.dirname(os.path.dirname(path)),
+            os.path.dirname(path),
+            path,
+        ):
+            self._listings.pop(directory, None)
+            self._extensions.pop(directory, None)
+        self._bindings.pop(path, None)
+        self._roots.pop(path, None)
+        self._specs.clear()
+        self._stub_specs.clear()
+        self._results.clear()
+
+    def _resolve(self, module: str, import_: str, depth: int) -> Optional[bool]:
+        if "." in import_ or depth > MAX_DEPTH:
+            return None
+        spec = self.find_spec(module)
+        origin = spec[0] if spec is not None else None
+        has_submodule = (
+            spec is not None
+            and spec[1] is not None
+            and self._find_in(import_, spec[1]) is not None
+        )
+        if spec is None or origin is not None and not _is_source(origin):
+            stub = self.find_stub_spec(module)
+            if stub is None:
+                return None
+            origin = stub[0]
+            has_submodule = has_submodule or (
+                stub[1] is not None
+                and self._find_in(import_, stub[1], STUB_SUFFIXES) is not None
+            )
+        elif origin is None:  # namespace packages only contain submodules
+            return has_submodule
+        bindings = self._module_bindings(origin)
+        if bindings is None:
+            return None
+        names, dynamic = bindings
+        if dynamic:
+            return None
+        if import_ not in names:
+            if import_ == "__builtins__":
+                return None
+            return has_submodule
+        results = {
+            self._resolve_binding(
+                binding, module, import_, origin, has_submodule, depth
+            )
+            for binding in names[import_]
+        }
+        if len(results) != 1 or None in results:
+            return None
+        result = results.pop()
+        if has_submodule and not result:
+            # Whether the submodule overwrites the attribute depends on the import order.
+            return None
+        return result
+
+    def _resolve_binding(
+        self,
+        binding: _Binding,
+        module: str,
+        import_: str,
+        origin: str,
+        has_submodule: bool,
+        depth: int,
+    ) -> Optional[bool]:
+        if binding == ATTRIBUTE:
+            return False
+        if binding == MODULE:
+            return True
+        if binding[0] != "from":
+            return None
+        _, level, from_, name = binding
+        if level > 0:
+            package = (
+                module
+                if os.path.basename(origin).startswith("__init__.")
+                else module.rpartition(".")[0]
+            )
+            try:
+                from_ = importlib.util.resolve_name(
+                    "." * level + from_, package
+                )
+            except (ImportError, ValueError):
+                return None
+        if (from_, name) == (module, import_):
+            # "from . import x" in the __init__ file of a package.
+            return True if has_submodule else None
+        return self.resolve(from_, name, depth + 1)
+
+    def find_spec(self, module: str) -> Optional[_Spec]:
+        """
+        Looks up the origin file and submodule search locations of an absolute module name, following the rules of
+        the default path based import system. Returns None if the module cannot be found that way.
+        """
+        if module not in self._specs:
+            parts = module.split(".")
+            if not module or parts[0] in self.builtin_module_names:
+                spec = None
+            else:
+                spec = self._find_top_level(parts[0])
+            for part in parts[1:]:
+                if spec is None or spec[1] is None:
+                    spec = None
+                    break
+                spec = self._find_in(part, spec[1])
+            self._specs[module] = spec
+        return self._specs[module]
+
+    def find_stub_spec(self, module: str) -> Optional[_Spec]:
+        """
+        Looks up the stub file describing an absolute module name.
+        The returned submodule search locations only contain stub files.
+        """
+        if module not in self._stub_specs:
+            parts = module.split(".")
+            directories = self._search_directories()
+            candidates = [
+                (self.stub_paths, parts[0]),
+                (directories, parts[0] + "-stubs"),
+                (directories, parts[0]),
+                (self._typeshed(parts[0]), parts[0]),
+            ]
+            self._stub_specs[module] = None
+            for roots, top_level in candidates:
+                spec = self._find_in(top_level, roots, STUB_SUFFIXES)
+                for part in parts[1:]:
+                    if spec is None or spec[1] is None:
+                        spec = None
+                        break
+                    spec = self._find_in(part, spec[1], STUB_SUFFIXES)
+                if spec is not None and spec[0] is not None:
+                    self._stub_specs[module] = spec
+                    break
+        return self._stub_specs[module]
+
+    def _search_directories(self) -> List[str]:
+        return [
+            path
+            for path in self.search_paths
+            if self._kind(path) == stat.S_IFDIR
+        ]
+
+    def _typeshed(self, top_level: str) -> List[str]:
+        """Returns the directories of bundled typeshed stubs which cover the given top level module."""
+        if self._typeshed_paths is None:
+            self._typeshed_paths = []
+            for package, location in TYPESHED_LOCATIONS.items():
+                spec = self.find_spec(package)
+                if spec is not None and spec[1]:
+                    path = os.path.join(spec[1][0], *location)
+                    if self._kind(path) == stat.S_IFDIR:
+                        self._typeshed_paths.append(path)
+        return [
+            path
+            for path in self._typeshed_paths
+            if _typeshed_supports(path, top_level)
+        ]
+
+    def _find_top_level(self, name: str) -> Optional[_Spec]:
+        if name not in self._claimed:
+            self._claimed[name] = _claimed_by_meta_path(name)
+        if self._claimed[name]:
+            return None
+        directories = []
+        for path in self.search_paths:
+            kind = self._kind(path)
+            if kind == stat.S_IFDIR:
+                directories.append(path)
+            elif kind is not None:
+                # A zip archive or similar. Lookups inside are not supported, so later entries can not be trusted.
+                spec = self._find_in(name, directories)
+                return spec if spec is not None and spec[0] else None
+        return self._find_in(name, directories)
+
+    def _find_in(
+        self,
+        name: str,
+        directories: Sequence[str],
+        suffixes: Optional[Sequence[str]] = None,
+    ) -> Optional[_Spec]:
+        """
+        Searches for a module or package with the given name in the given directories.
+
+        :param suffixes The file name suffixes of modules, by default those of source, bytecode and extension modules.
+        """
+        any_extension = suffixes is None and self.any_extension
+        if suffixes is None:
+            suffixes = self.module_suffixes
+        namespace = []
+        for directory in directories:
+            entries = self._listdir(directory)
+            if not entries:
+                continue
+            base = os.path.join(directory, name)
+            is_dir = entries.get(name) == stat.S_IFDIR
+            if is_dir:
+                package_entries = self._listdir(base) or {}
+                extension = any_extension and self._extension(
+                    base, package_entries, "__init__"
+                )
+                if extension:
+                    return os.path.join(base, extension), [base]
+                for suffix in suffixes:
+                    if package_entries.get("__init__" + suffix) == stat.S_IFREG:
+                        return os.path.join(base, "__init__" + suffix), [base]
+            extension = any_extension and self._extension(
+                directory, entries, name
+            )
+            if extension:
+                return os.path.join(directory, extension), None
+            for suffix in suffixes:
+                if entries.get(name + suffix) == stat.S_IFREG:
+                    return base + suffix, None
+            if is_dir:
+                namespace.append(base)
+        return (None, namespace) if namespace else None
+
+    def _extension(
+        self, directory: str, entries: Dict[str, int], name: str
+    ) -> Optional[str]:
+        """Returns the file name of an extension module with the given name built for any Python version and platform."""
+        if directory not in self._extensions:
+            extensions: Dict[str, str] = {}
+            for entry, kind in sorted(entries.items()):
+                match = EXTENSION_FILE.fullmatch(entry)
+                if match and kind == stat.S_IFREG:
+                    extensions.setdefault(match[1], entry)
+            self._extensions[directory] = extensions
+        return self._extensions[directory].get(name)
+
+    def _listdir(self, directory: str) -> Optional[Dict[str, int]]:
+        """
+        Returns the file types (as in stat.S_IFMT) of all entries of a directory, or None if it cannot be listed.
+        Every directory is listed at most once.
+        """
+        if directory not in self._listings:
+            self._listings[directory] = _scan_directory(directory)
+        return self._listings[directory]
+
+    def _kind(self, path: str) -> Optional[int]:
+        """Returns the file type (as in stat.S_IFMT) of the given path, or None if it does not exist."""
+        directory, name = os.path.split(path)
+        if path in self.search_paths or not name:
+            if path not in self._roots:
+                self._roots[path] = _stat_kind(path)
+            return self._roots[path]
+        return (self._listdir(directory) or {}).get(name)
+
+    def _prefetch_directories(self, directories: Set[str]) -> None:
+        directories = sorted(
+            directory
+            for directory in directories
+            if directory not in self._listings
+        )
+        if len(directories) <= 1 or self.max_workers <= 1:
+            return
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="imr-prefetch"
+            )
+        for directory, entries in zip(
+            directories, self._executor.map(_scan_directory, directories)
+        ):
+            self._listings[directory] = entries
+
+    def _module_bindings(
+        self, origin: str
+    ) -> Optional[Tuple[Dict[str, list], bool]]:
+        if origin not in self._bindings:
+            self._bindings[origin] = None
+            if _is_source(origin) or origin.endswith(tuple(STUB_SUFFIXES)):
+                try:
+                    tree = ast.parse(self._read(origin), origin)
+                except (OSError, SyntaxError, ValueError):
+                    pass
+                else:
+                    self._bindings[origin] = _scan_bindings(
+                        tree, stub=origin.endswith(tuple(STUB_SUFFIXES))
+                    )
+        return self._bindings[origin]
+
+    def _read(self, path: str) -> bytes:
+        with open(path, "rb") as file:
+            return file.read()
+
+
+def _claimed_by_meta_path(name: str) -> bool:
+    """
+    Tests whether an import hook in front of or instead of the path based finder, e.g. of setuptools or of an
+    editable install, provides the given top level module. Such modules are not found where the file system suggests.
+    """
+    for finder in sys.meta_path:
+        if finder in STANDARD_FINDERS:
+            continue
+        try:
+            if finder.find_spec(name, None) is not None:
+                return True
+        except Exception:  # pylint: disable=broad-except
+            return True
+    return False
+
+
+def _is_source(path: str) -> bool:
+    return path.endswith(tuple(SOURCE_SUFFIXES))
+
+
+def _typeshed_supports(stdlib_path: str, top_level: str) -> bool:
+    """Tests whether typeshed's VERSIONS file lists the module as available in the running Python version."""
+    versions = _typeshed_versions(stdlib_path)
+    if versions is None:
+        return True
+    if top_level not in versions:
+        return False
+    minimum, maximum = versions[top_level]
+    return minimum <= sys.version_info[:2] and (
+        maximum is None or sys.version_info[:2] <= maximum
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _typeshed_versions(
+    stdlib_path: str,
+) -> Optional[Dict[str, Tuple[Tuple[int, ...], Optional[Tuple[int, ...]]]]]:
+    try:
+        with open(
+            os.path.join(stdlib_path, "VERSIONS"), encoding="utf-8"
+        ) as file:
+            lines = file.readlines()
+    except OSError:
+        return None
+    versions = {}
+    for line in lines:
+        module, _, bounds = line.split("#")[0].partition(":")
+        if not bounds.strip():
+            continue
+        minimum, _, maximum = bounds.strip().partition("-")
+        versions[module.strip()] = (
+            _parse_version(minimum),
+            _parse_version(maximum) if maximum.strip() else None,
+        )
+    return versions
+
+
+def _parse_version(version: str) -> Tuple[int, ...]:
+    return tuple(int(part) for part in version.strip().split("."))
+
+
+def _stat_kind(path: str) -> Optional[int]:
+    try:
+        return stat.S_IFMT(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return None
+
+
+def _scan_directory(directory: str) -> Optional[Dict[str, int]]:
+    try:
+        with os.scandir(directory) as iterator:
+            entries = {}
+            for entry in iterator:
+                try:
+                    if entry.is_dir():
+                        entries[entry.name] = stat.S_IFDIR
+                    elif entry.is_file():
+                        entries[entry.name] = stat.S_IFREG
+                except OSError:  # e.g. broken symlinks
+                    pass
+            return entries
+    except (OSError, ValueError):
+        return None
+
+
+def _scan_bindings(
+    tree: ast.Module, stub: bool = False
+) -> Tuple[Dict[str, list], bool]:
+    """
+    Collects all bindings of names in the global namespace of a module.
+    Also returns whether the module modifies its namespace in ways that cannot be followed statically.
+
+    :param stub Apply the export rules of stub files (PEP 484): imports are only exported in the "import X as X" form,
+    and names starting with an underscore are private.
+    """
+    names: Dict[str, list] = defaultdict(list)
+    dynamic = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id in DYNAMIC_NAMES:
+            dynamic = True
+        elif isinstance(node, ast.Attribute) and (
+            node.attr in DYNAMIC_NAMES
+            or node.attr == "modules"
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "sys"
+        ):
+            dynamic = True
+        elif isinstance(node, ast.Global):
+            for name in node.names:
+                names[name].append(UNKNOWN)
+
+    statements = list(tree.body)
+    while statements:
+        statement = statements.pop()
+        if isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if not stub or alias.asname == alias.name:
+                    names[alias.asname or alias.name.split(".")[0]].append(
+                        MODULE
+                    )
+        elif isinstance(statement, ast.ImportFrom):
+            for alias in statement.names:
+                if alias.name == "*":
+                    dynamic = True
+                elif not stub or alias.asname == alias.name:
+                    names[alias.asname or alias.name].append(
+                        (
+                            "from",
+                            statement.level,
+                            statement.module or "",
+                            alias.name,
+                        )
+                    )
+        elif isinstance(
+            statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        ):
+            names[statement.name].append(ATTRIBUTE)
+            if statement.name == "__getattr__":
+                dynamic = True
+        elif isinstance(statement, (ast.Assign, ast.AnnAssign)):
+            targets = (
+                statement.targets
+                if isinstance(statement, ast.Assign)
+                else [statement.target]
+            )
+            kind = _value_binding(statement.value)
+            for target in targets:
+                for node in ast.walk(target):
+                    if isinstance(node, ast.Name) and isinstance(
+                        node.ctx, ast.Store
+                    ):
+                        names[node.id].append(
+                            kind if node is target else UNKNOWN
+                        )
+        else:
+            for field in ("body", "orelse", "finalbody", "handlers", "cases"):
+                statements += getattr(statement, field, [])
+            for node in _iter_non_body_nodes(statement):
+                if isinstance(node, ast.Name) and isinstance(
+                    node.ctx, (ast.Store, ast.Del)
+                ):
+                    names[node.id].append(UNKNOWN)
+            if isinstance(statement, ast.ExceptHandler) and statement.name:
+                names[statement.name].append(UNKNOWN)
+    if stub:
+        for name in list(names):
+            if name.startswith("_") and not name.startswith("__"):
+                del names[name]
+    return names, dynamic
+
+
+def _iter_non_body_nodes(statement: ast.AST) -> Iterable[ast.AST]:
+    """Walks all nodes of a statement, except for the nested statements in its bodies."""
+    todo = [
+        child
+        for field, value in ast.iter_fields(statement)
+        if field not in ("body", "orelse", "finalbody", "handlers", "cases")
+        for child in (value if isinstance(value, list) else [value])
+        if isinstance(child, ast.AST)
+    ]
+    while todo:
+        node = todo.pop()
+        yield node
+        todo.extend(ast.iter_child_nodes(node))
+
+
+def _value_binding(value: Optional[ast.AST]) -> _Binding:
+    """Approximates whether the result of an expression may be a module."""
+    if value is None:
+        return ATTRIBUTE
+    if isinstance(value, (ast.Name, ast.Attribute, ast.Subscript, ast.Starred)):
+        return UNKNOWN
+    if isinstance(value, ast.Call):
+        func = value.func
+        func_name = (
+            func.id
+            if isinstance(func, ast.Name)
+            else func.attr if isinstance(func, ast.Attribute) else ""
+        )
+        return UNKNOWN if func_name in IMPORT_CALLS else ATTRIBUTE
+    if isinstance(value, ast.IfExp):
+        body, orelse = _value_binding(value.body), _value_binding(value.orelse)
+        return body if body == orelse else UNKNOWN
+    if isinstance(value, (ast.BoolOp, ast.NamedExpr, ast.Await, ast.Yield)):
+        return UNKNOWN
+    return ATTRIBUTE
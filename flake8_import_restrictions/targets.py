@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+from typing import Dict, List, Optional, Sequence
+
+# Prints the search path of a target interpreter, without the directory it is started in, and what it considers a
+# module besides source and bytecode files.
+_ENVIRONMENT_SCRIPT = (
+    "import importlib.machinery, json, sys; "
+    "print(json.dumps([sys.path, importlib.machinery.EXTENSION_SUFFIXES, sys.builtin_module_names]))"
+)
+
+
+class Target:
+    """
+    An environment to resolve imports in, besides the one running the checks.
+
+    :param paths The search path of the environment.
+    :param extension_suffixes The file name suffixes of extension modules, or None if they are unknown. Extension
+    modules built for any Python version and platform are then recognized.
+    :param builtin_module_names The modules compiled into the interpreter of the environment.
+    """
+
+    def __init__(
+        self,
+        paths: List[str],
+        extension_suffixes: Optional[List[str]] = None,
+        builtin_module_names: Sequence[str] = (),
+    ):
+        self.paths = paths
+        self.extension_suffixes = extension_suffixes
+        self.builtin_module_names = frozenset(builtin_module_names)
+
+
+def parse_targets(entries: Sequence[str]) -> Dict[str, Target]:
+    """
+    Parses target environments given as "NAME=PATH", where PATH is either a list of directories separated by
+    os.pathsep, such as the stdlib and site-packages directories of another interpreter, or the executable of that
+    interpreter, which is then queried.
+
+    :return The targets, by name, in the given order.
+    """
+    targets = {}
+    for entry in entries:
+        name, separator, paths = entry.partition("=")
+        if not separator or not name or not paths:
+            raise ValueError(
+                f"expected a target of the form NAME=PATH, got {entry!r}"
+            )
+        if name in targets:
+            raise ValueError(f"target {name!r} is given more than once")
+        if os.path.isfile(paths):
+            targets[name] = query_interpreter(paths)
+        else:
+            targets[name] = Target(
+                [path for path in paths.split(os.pathsep) if path]
+            )
+    return targets
+
+
+def query_interpreter(executable: str) -> Target:
+    """Returns the environment of the given Python interpreter, as seen by a script outside of any project."""
+    try:
+        output = subprocess.run(
+            [executable, "-I", "-c", _ENVIRONMENT_SCRIPT],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+        paths, extension_suffixes, builtin_module_names = json.loads(output)
+    except (OSError, subprocess.CalledProcessError, ValueError) as error:
+        raise ValueError(
+            f"cannot query the environment of {executable}: {error}"
+        ) from error
+    return Target(
+        [path for path in paths if path and os.path.isdir(path)],
+        extension_suffixes,
+        builtin_module_names,
+    )
@@ -0,0 +1,189 @@
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from flake8_import_restrictions import standalone
+from flake8_import_restrictions.directory_config import CONFIG_FILES
+from flake8_import_restrictions.import_records import ImportRecord
+from flake8_import_restrictions.imports_submodule import absolute_module
+
+# The modification time and size of a file, used to detect changes.
+_Stamp = Tuple[int, int]
+
+
+class DependencyIndex:
+    """
+    Reverse index from the (module, name) pairs of "from module import name" statements to the files containing them.
+    The results of IMR241 and IMR242 for a file only change if one of these pairs resolves differently.
+    """
+
+    def __init__(self):
+        self._dependents: Dict[str, Dict[str, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        self._dependencies: Dict[str, Set[Tuple[str, str]]] = {}
+        self._modules: Dict[str, Optional[str]] = {}
+
+    def update(self, filename: str, records: Iterable[ImportRecord]) -> None:
+        self.remove(filename)
+        search_paths = sys.path + [os.getcwd()]
+        dependencies = set()
+        for record in records:
+            if not record.is_from:
+                continue
+            module = absolute_module(
+                filename, record.level, record.module or "", search_paths
+            )
+            if module is not None:
+                dependencies.update((module, name) for name in record.names)
+        for module, name in dependencies:
+            self._dependents[module][name].add(filename)
+        self._dependencies[filename] = dependencies
+        self._modules[filename] = standalone.module_name(filename)
+
+    def remove(self, filename: str) -> None:
+        for module, name in self._dependencies.pop(filename, ()):
+            self._dependents[module][name].discard(filename)
+        self._modules.pop(filename, None)
+
+    def affected_by(self, module: str) -> Set[str]:
+        """
+        Returns the files whose imports may resolve differently after the given module changed. A module importing
+        from the changed module may re-export what it imports, so the files importing from that module are affected
+        as well, and so on.
+        """
+        affected: Set[str] = set()
+        pending = [module]
+        visited = {module}
+        while pending:
+            module = pending.pop()
+            parent, _, name = module.rpartition(".")
+            dependents = set(self._dependents.get(parent, {}).get(name, ()))
+            for filenames in self._dependents.get(module, {}).values():
+                dependents |= filenames
+            for filename in dependents - affected:
+                affected.add(filename)
+                dependent = self._modules.get(filename)
+                if dependent is not None and dependent not in visited:
+                    visited.add(dependent)
+                    pending.append(dependent)
+        return affected
+
+
+class Watcher:
+    """
+    Re-checks the Python files below the given paths whenever they change. Besides the changed files themselves, only
+    the files whose from-imports refer to a changed module are re-checked.
+    Changes are detected by polling modification times, which works on every platform and file system.
+    """
+
+    def __init__(self, paths: List[str]):
+        self.paths = paths
+        self.index = DependencyIndex()
+        self.reports: Dict[str, List[standalone.Report]] = {}
+        self._stamps: Dict[str, _Stamp] = {}
+
+    def check_all(self) -> Dict[str, List[standalone.Report]]:
+        """Checks all files. Returns the reports of every file."""
+        self._stamps = self._scan()
+        return self._check(
+            [filename for filename in self._stamps if filename.endswith(".py")]
+        )
+
+    def poll(self) -> Dict[str, List[standalone.Report]]:
+        """Checks the files affected by changes since the last call. Returns the current reports of those files."""
+        stamps = self._scan()
+        changed = {
+            filename
+            for filename in stamps.keys() | self._stamps.keys()
+            if stamps.get(filename) != self._stamps.get(filename)
+        }
+        self._stamps = stamps
+        if not changed:
+            return {}
+        for filename in changed:
+            standalone.invalidate(filename)
+        if any(
+            os.path.basename(filename) in CONFIG_FILES for filename in changed
+        ):
+            to_check = set(self.reports)
+        else:
+            to_check = {filename for filename in changed if filename in stamps}
+            affected = set()
+            for filename in changed:
+                module = standalone.module_name(filename)
+                if module is not None:
+                    affected |= self.index.affected_by(module)
+            # What was cached about modules re-exporting from a changed module is stale as well.
+            for filename in affected - changed:
+                standalone.invalidate(filename)
+            to_check |= affected
+        for filename in changed - stamps.keys():
+            self.index.remove(filename)
+            self.reports.pop(filename, None)
+        results = self._check(
+            sorted(
+                filename
+                for filename in to_check
+                if filename in stamps and filename.endswith(".py")
+            )
+        )
+        results.update({filename: [] for filename in changed - stamps.keys()})
+        return results
+
+    def run(
+        self,
+        interval: float,
+        output: Callable[[Dict[str, List[standalone.Report]]], None],
+        iterations: Optional[int] = None,
+    ) -> None:
+        output(self.check_all())
+        while iterations is None or iterations > 0:
+            time.sleep(interval)
+            results = self.poll()
+            if results:
+                output(results)
+            if iterations is not None:
+                iterations -= 1
+
+    def _check(
+        self, filenames: List[str]
+    ) -> Dict[str, List[standalone.Report]]:
+        results = {}
+        for filename in filenames:
+            source = standalone.read_source(filename)
+            reports, records = (
+                standalone.check(source, filename)
+                if source is not None
+                else ([], [])
+            )
+            self.index.update(filename, records)
+            self.reports[filename] = results[filename] = reports
+        return results
+
+    def _scan(self) -> Dict[str, _Stamp]:
+        stamps: Dict[str, _Stamp] = {}
+        for path in self.paths:
+            if not os.path.isdir(path):
+                _add_stamp(stamps, path)
+                continue
+            for directory, subdirectories, filenames in os.walk(path):
+                subdirectories[:] = [
+                    subdirectory
+                    for subdirectory in subdirectories
+                    if not subdirectory.startswith(".")
+                ]
+                for filename in filenames:
+                    if filename.endswith(".py") or filename in CONFIG_FILES:
+                        _add_stamp(stamps, os.path.join(directory, filename))
+        return stamps
+
+
+def _add_stamp(stamps: Dict[str, _Stamp], filename: str) -> None:
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return
+    stamps[filename] = (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,113 @@
+import io
+import os
+import sys
+import tarfile
+import zipfile
+
+import pytest
+
+from flake8_import_restrictions import __main__, standalone
+from flake8_import_restrictions.archives import Archive, ArchiveResolver
+
+FILES = {
+    "vendored/__init__.py": "from vendored.util import helper\n",
+    "vendored/util.py": "def helper(): pass\n",
+    "vendored/sub/__init__.py": "",
+    "vendored/sub/mod.py": "from .. import util\nfrom ..util import helper\n",
+    "vendored-1.0.dist-info/METADATA": "Name: vendored\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def _in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def _write_zip(path, files, prefix=b""):
+    with open(path, "wb") as file:
+        file.write(prefix)
+        with zipfile.ZipFile(file, "w") as archive:
+            for name, content in files.items():
+                archive.writestr(name, content)
+
+
+def _write_tar(path, files):
+    with tarfile.open(path, "w:gz") as archive:
+        for name, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+def _codes(reports):
+    return [
+        (os.path.relpath(filename), line, message.split()[0])
+        for filename, line, _, message in reports
+    ]
+
+
+def test_wheel():
+    _write_zip("vendored-1.0-py3-none-any.whl", FILES)
+    standalone.parse_args(["--imr_static_resolution"])
+    reports = standalone.check_archive("vendored-1.0-py3-none-any.whl")
+    assert "vendored" not in sys.modules
+    wheel = "vendored-1.0-py3-none-any.whl"
+    assert sorted(_codes(reports)) == [
+        (os.path.join(wheel, "vendored", "__init__.py"), 1, "IMR241"),
+        (os.path.join(wheel, "vendored", "sub", "mod.py"), 2, "IMR241"),
+    ]
+
+
+def test_unreadable_archive():
+    with open("broken.whl", "wb") as file:
+        file.write(b"not a zip file")
+    standalone.parse_args([])
+    reports = standalone.check_archive("broken.whl")
+    assert _codes(reports) == [("broken.whl", 1, "E902")]
+    assert "BadZipFile" in reports[0][3]
+
+
+def test_sdist():
+    _write_tar(
+        "vendored-1.0.tar.gz",
+        {
+            **{
+                f"vendored-1.0/src/{name}": text for name, text in FILES.items()
+            },
+            "vendored-1.0/setup.py": "from vendored import util\n",
+        },
+    )
+    archive = Archive("vendored-1.0.tar.gz")
+    assert archive.roots() == ["vendored-1.0", "vendored-1.0/src"]
+    assert (
+        archive.module_name("vendored-1.0/src/vendored/sub/mod.py")
+        == "vendored.sub.mod"
+    )
+    standalone.parse_args([])
+    resolver = ArchiveResolver(archive)
+    assert resolver.resolve("vendored", "util") is True
+    assert resolver.resolve("vendored.util", "helper") is False
+    assert resolver.resolve("os", "path") is None
+    reports = standalone.check_archive("vendored-1.0.tar.gz")
+    assert (
+        os.path.join("vendored-1.0.tar.gz", "vendored-1.0", "setup.py"),
+        1,
+        "IMR241",
+    ) not in _codes(reports)
+
+
+def test_zipapp_main(capsys):
+    _write_zip(
+        "app.pyz",
+        {"__main__.py": "from os.path import join\nimport app_pkg.a as x\n"},
+        prefix=b"#!/usr/bin/env python3\n",
+    )
+    _write_zip("broken.whl", {})
+    with open("broken.whl", "wb") as file:
+        file.write(b"not a zip file")
+    assert __main__.main(["app.pyz", "broken.whl"]) == 1
+    assert [
+        line.split(": ")[1].split()[0]
+        for line in capsys.readouterr().out.splitlines()
+    ] == ["IMR241", "IMR201", "E902"]
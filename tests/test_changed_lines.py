@@ -0,0 +1,153 @@
+import os
+import subprocess
+import textwrap
+
+import pytest
+
+from flake8_import_restrictions import standalone
+from flake8_import_restrictions.changed_lines import ChangedLines, parse_diff
+from flake8_import_restrictions.import_records import ImportRecord
+from tests.util import ReportedMessage
+
+DIFF = textwrap.dedent(
+    """\
+    diff --git a/pkg/a.py b/pkg/a.py
+    index 1111111..2222222 100644
+    --- a/pkg/a.py
+    +++ b/pkg/a.py
+    @@ -1,0 +2,2 @@
+    +import os
+    +import sys
+    @@ -5 +7 @@
+    -import re
+    +import re as regex
+    @@ -9,3 +10,0 @@
+    -x = 1
+    diff --git a/gone.py b/gone.py
+    --- a/gone.py
+    +++ /dev/null
+    @@ -1 +0,0 @@
+    -import os
+    """
+)
+
+
+def _record(lineno, end_lineno=None):
+    return ImportRecord(
+        False, None, 0, ("os",), (None,), lineno, 0, end_lineno or lineno, False
+    )
+
+
+def test_parse_diff(tmp_path):
+    ranges = parse_diff(DIFF, str(tmp_path))
+    assert ranges == {
+        os.path.normcase(os.path.realpath(tmp_path / "pkg" / "a.py")): [
+            (2, 3),
+            (7, 7),
+        ]
+    }
+
+
+def test_parse_diff_special_paths(tmp_path):
+    diff = textwrap.dedent(
+        """\
+        diff --git a/a.py b/a.py
+        --- a/a.py
+        +++ b/a.py
+        @@ -0,0 +1 @@
+        +++ b/fake.py
+        diff --git "a/na\\303\\257ve.py" "b/na\\303\\257ve.py"
+        --- "a/na\\303\\257ve.py"
+        +++ "b/na\\303\\257ve.py"
+        @@ -0,0 +1,2 @@
+        +import os
+        +import sys
+        diff --git a/my file.py b/my file.py
+        --- a/my file.py\t
+        +++ b/my file.py\t
+        @@ -0,0 +5 @@
+        +import os
+        diff --git "a/tab\\tquote\\".py" "b/tab\\tquote\\".py"
+        +++ "b/tab\\tquote\\".py"
+        @@ -2,0 +3 @@
+        +import os
+        """
+    )
+
+    def path(name):
+        return os.path.normcase(os.path.realpath(tmp_path / name))
+
+    assert parse_diff(diff, str(tmp_path)) == {
+        path("a.py"): [(1, 1)],
+        path("naïve.py"): [(1, 2)],
+        path("my file.py"): [(5, 5)],
+        path('tab\tquote".py'): [(3, 3)],
+    }
+
+
+def test_filter(tmp_path):
+    changed_lines = ChangedLines(parse_diff(DIFF, str(tmp_path)))
+    filename = str(tmp_path / "pkg" / "a.py")
+    records = [_record(1), _record(3), _record(4, 7), _record(8)]
+    assert changed_lines.filter(filename, records) == records[1:3]
+    assert changed_lines.touches(filename)
+    assert not changed_lines.touches(str(tmp_path / "gone.py"))
+    assert changed_lines.filter(str(tmp_path / "b.py"), records) == []
+
+
+def _git(directory, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        + list(args),
+        cwd=directory,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def test_flake8(flake8_path):
+    (flake8_path / "a.py").write_text("import os.path\nimport sys\n")
+    (flake8_path / "b.py").write_text("import os.path\n")
+    _git(flake8_path, "init", "-q")
+    _git(flake8_path, "add", ".")
+    _git(flake8_path, "commit", "-q", "-m", "initial")
+    (flake8_path / "a.py").write_text(
+        "import os.path\nimport sys\nimport xml.dom\n"
+    )
+    result = flake8_path.run_flake8(
+        ["--select=IMR220", "--imr220_include=*", "--imr_diff=HEAD"]
+    )
+    reports = [ReportedMessage.from_raw(line) for line in result.out_lines]
+    assert [(report.file, report.line) for report in reports] == [("./a.py", 3)]
+
+
+def test_from_git_special_paths(tmp_path):
+    names = ["a.py", "my file.py", "naïve.py"]
+    for name in names:
+        (tmp_path / name).write_text("import os\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    for name in names:
+        (tmp_path / name).write_text("import os\nimport sys\n")
+    changed_lines = ChangedLines.from_git("HEAD", str(tmp_path))
+    for name in names:
+        filename = str(tmp_path / name)
+        assert changed_lines.touches(filename)
+        records = [_record(1), _record(2)]
+        assert changed_lines.filter(filename, records) == records[1:]
+
+
+def test_outside_git_work_tree(flake8_path, tmp_path, monkeypatch, capsys):
+    (flake8_path / "a.py").write_text("import os.path\n")
+    result = flake8_path.run_flake8(["--imr_diff=HEAD"])
+    assert result.exit_code == 1
+    assert "--imr_diff requires a git work tree" in result.out
+    assert "not a git repository" in result.out
+    assert "Traceback" not in result.out + result.err
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PATH", "")
+    with pytest.raises(SystemExit):
+        standalone.parse_args(["--imr_diff=HEAD"])
+    assert "cannot run git" in capsys.readouterr().err
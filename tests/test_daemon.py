@@ -0,0 +1,120 @@
+import io
+import json
+
+from flake8_import_restrictions import daemon, standalone
+
+
+def _encode(messages) -> io.BytesIO:
+    stream = io.BytesIO()
+    for message in messages:
+        daemon.write_message(stream, {"jsonrpc": "2.0", **message})
+    stream.seek(0)
+    return stream
+
+
+def _decode(stream: io.BytesIO):
+    stream.seek(0)
+    messages = []
+    while True:
+        message = daemon.read_message(stream)
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+def test_session(tmp_path):
+    standalone.parse_args([])
+    uri = (tmp_path / "example.py").as_uri()
+    requests = [
+        {"id": 1, "method": "initialize", "params": {}},
+        {"method": "initialized", "params": {}},
+        {
+            "method": "textDocument/didOpen",
+            "params": {
+                "textDocument": {"uri": uri, "text": "import os as o\n"}
+            },
+        },
+        {
+            "method": "textDocument/didChange",
+            "params": {
+                "textDocument": {"uri": uri},
+                "contentChanges": [{"text": "import os\n"}],
+            },
+        },
+        {
+            "id": 2,
+            "method": "imr/check",
+            "params": {"filename": "other.py", "text": "from os import *\n"},
+        },
+        {"id": 3, "method": "unknown/method", "params": {}},
+        {"id": 4, "method": "shutdown"},
+        {"method": "exit"},
+        {"id": 5, "method": "shutdown"},
+    ]
+    output = io.BytesIO()
+    daemon.serve(_encode(requests), output)
+    responses = _decode(output)
+
+    assert [response.get("id") for response in responses] == [
+        1,
+        None,
+        None,
+        2,
+        3,
+        4,
+    ]
+    assert "textDocumentSync" in responses[0]["result"]["capabilities"]
+    diagnostics = responses[1]["params"]["diagnostics"]
+    assert [diagnostic["code"] for diagnostic in diagnostics] == ["IMR201"]
+    assert diagnostics[0]["range"] == {
+        "start": {"line": 0, "character": 0},
+        "end": {"line": 0, "character": 14},
+    }
+    assert responses[2]["params"] == {"uri": uri, "diagnostics": []}
+    assert "IMR243" in [d["code"] for d in responses[3]["result"]]
+    assert "error" in responses[4]
+    assert json.dumps(responses[5]["result"]) == "null"
+
+
+def test_errors_keep_the_server_running(tmp_path):
+    standalone.parse_args([])
+    stream = _encode(
+        [
+            {"id": 1, "method": "imr/check", "params": {}},
+            {"id": 2, "method": "imr/check", "params": {"filename": "x.py"}},
+            {"method": "textDocument/didOpen", "params": {}},
+        ]
+    )
+    stream.seek(0, io.SEEK_END)
+    stream.write(b"Content-Length: 5\r\n\r\n{oops")
+    stream.write(b"Content-Length: many\r\n\r\n")
+    daemon.write_message(stream, {"jsonrpc": "2.0", "id": 3, "method": "x"})
+    daemon.write_message(stream, [1, 2])
+    stream.seek(0)
+    output = io.BytesIO()
+    daemon.serve(stream, output)
+    responses = _decode(output)
+
+    assert [response.get("id") for response in responses] == [
+        1,
+        2,
+        None,
+        None,
+        None,
+        3,
+        None,
+    ]
+    assert [
+        response["error"]["code"]
+        for response in responses
+        if "error" in response
+    ] == [
+        daemon.INVALID_PARAMS,
+        daemon.INTERNAL_ERROR,
+        daemon.PARSE_ERROR,
+        daemon.PARSE_ERROR,
+        daemon.METHOD_NOT_FOUND,
+        daemon.INVALID_REQUEST,
+    ]
+    assert responses[2]["method"] == "window/logMessage"
+    assert "textDocument/didOpen" in responses[2]["params"]["message"]
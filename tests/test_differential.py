@@ -0,0 +1,8 @@
+from benchmarks import differential
+
+
+def test_synthetic_layouts(capsys):
+    comparisons, _, _ = differential.run_layouts(200, seed=1)
+    counts = differential.summarize("synthetic", comparisons, 1.0, 1.0)
+    assert counts["mismatches"] == 0, capsys.readouterr().out
+    assert counts["static"] > counts["queries"] / 2
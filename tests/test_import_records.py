@@ -0,0 +1,72 @@
+import ast
+import textwrap
+
+from flake8_import_restrictions.import_records import (
+    ImportRecord,
+    collect_imports,
+)
+
+
+def _collect(code: str):
+    return collect_imports(ast.parse(textwrap.dedent(code)))
+
+
+def test_fields():
+    records = _collect(
+        """
+        import os.path as osp, sys
+        from .. import (
+            a,
+            b as c,
+        )
+        """
+    )
+    assert records == [
+        ImportRecord(
+            False, None, 0, ("os.path", "sys"), ("osp", None), 2, 0, 2, False
+        ),
+        ImportRecord(True, None, 2, ("a", "b"), (None, "c"), 3, 0, 6, False),
+    ]
+
+
+def test_local():
+    records = _collect(
+        """
+        import os
+        if True:
+            import sys
+        def f():
+            import json
+            def g():
+                from os import path
+        class C:
+            import re
+            if TYPE_CHECKING:
+                import typing
+            else:
+                import abc
+        if typing.TYPE_CHECKING:
+            def h():
+                import ast
+        """
+    )
+    assert [(record.names[0], record.local) for record in records] == [
+        ("os", False),
+        ("sys", False),
+        ("json", True),
+        ("path", True),
+        ("re", True),
+        ("typing", False),
+        ("abc", True),
+        ("ast", False),
+    ]
+
+
+def test_interned():
+    first, second = _collect(
+        """
+        from some.module import a
+        from some.module import b
+        """
+    )
+    assert first.module is second.module
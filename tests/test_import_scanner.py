@@ -0,0 +1,70 @@
+import ast
+
+import pytest
+
+from flake8_import_restrictions.import_records import collect_imports
+from flake8_import_restrictions.import_scanner import scan_imports
+from flake8_import_restrictions.standalone import check_source, parse_args
+
+SOURCES = [
+    "x = 1\n",
+    "import os\nimport os.path as p, sys\n",
+    "from . import a\nfrom .. b import c as d\nfrom .x.y import *\n",
+    "from os import (\n    path,  # comment with ) and (\n    sep as s,\n)\n",
+    "from os import path, \\\n    sep\n",
+    "import os  # import sys\nimport re; x = 1\n",
+    '"""\nimport os\n"""\ns = "import sys"\n# import re\n',
+    "x = '''\n    import os\n'''\n",
+    "def f():\n    import os\n\n    def g():\n        from os import path\n",
+    "class A:\n    import os\n",
+    "async def f():\n    import os\n",
+    "from typing import TYPE_CHECKING\n"
+    "if TYPE_CHECKING:\n    import os\nelse:\n    import sys\n",
+    "def f():\n    if typing.TYPE_CHECKING:\n        import os\n"
+    "    elif TYPE_CHECKING:\n        import re\n    else:\n        import sys\n",
+    "try:\n    import os\nexcept ImportError:\n    os = None\n",
+    "def f(\n    a,\n) -> None:\n    '''\nimport x\n'''\n    import os\n",
+    "def f():\n    x = 1\n    # comment\n\n    import os\n",
+    "def f():\n    pass\nif x:\n    import os\n",
+    "reimport = 1\nimport_ = 2\nx.reimport()\n",
+    "if TYPE_CHECKING:\n    def f():\n        import os\n",
+    "import os\r\ndef f():\r\n    import sys\r\n",
+    "def f(x=')'):  # comment (\n    import os\n",
+    "if x == {'a': (1, 2)}['a']:\n    import os\n",
+    "def f():\n    while x := (\n        g()\n    ):\n        import os\n",
+]
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_same_as_collect_imports(source):
+    assert scan_imports(source) == collect_imports(ast.parse(source))
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "import os; import sys\n",
+        "if x: import os\n",
+        "def f(): import os\n",
+        "def f():\n    x = (\n1)\n    import os\n",
+        "def f():\n\timport os\n",
+        "if (TYPE_CHECKING):\n    import os\n",
+        "x = 1; \\\nimport os\n",
+        "def f():\n    y = (a if b\nelse c)\n    import os\n",
+        "class A:\n    y = [v for v in w\nif v]\n    import os\n",
+        "def f():\n    y = (a if b\nelse c)[1:\n]\n    import os\n",
+    ],
+)
+def test_ambiguous(source):
+    assert scan_imports(source) is None
+
+
+def test_standalone_falls_back_to_ast():
+    parse_args([])
+    scanned = "import os as o\nimport sys\n"
+    parsed = "import os as o; import sys\n"
+    assert scan_imports(parsed) is None
+    assert [report[1:] for report in check_source(scanned, "x.py")] == [
+        report[1:] for report in check_source(parsed, "x.py")
+    ]
+    assert len(check_source(parsed, "x.py")) == 1
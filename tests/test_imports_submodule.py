@@ -1,7 +1,11 @@
+import importlib
 import os.path
 import sys
 
-from flake8_import_restrictions.imports_submodule import imports_submodule
+from flake8_import_restrictions.imports_submodule import (
+    imports_submodule,
+    restore_modules,
+)
 
 FILE1 = __file__
 FILE2 = os.path.join(os.path.dirname(__file__), "resources", "dummy.py")
@@ -63,3 +67,45 @@ def test_relative_empty_from():
     finally:
         os.chdir(old_cwd)
         sys.path = old_sys_path
+
+
+def test_failing_import(tmp_path, monkeypatch):
+    (tmp_path / "broken.py").write_text("raise RuntimeError('no GPU')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert imports_submodule(FILE1, 0, "broken", "x") is None
+
+
+def test_failing_module_getattr(tmp_path, monkeypatch):
+    (tmp_path / "lazy_broken").mkdir()
+    (tmp_path / "lazy_broken" / "__init__.py").write_text(
+        "def __getattr__(name):\n    raise RuntimeError(name)\n"
+    )
+    (tmp_path / "value_error").mkdir()
+    (tmp_path / "value_error" / "__init__.py").write_text("")
+    (tmp_path / "value_error" / "sub.py").write_text("raise ValueError()\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert imports_submodule(FILE1, 0, "lazy_broken", "x") is None
+    if sys.version_info >= (3, 9):
+        assert imports_submodule(FILE1, 0, "value_error", "sub") is None
+
+
+def test_sys_path_restored():
+    old_sys_path = list(sys.path)
+    imports_submodule(FILE1, 0, "os", "path")
+    assert sys.path == old_sys_path
+
+
+def test_restore_modules(tmp_path, monkeypatch):
+    (tmp_path / "restored").mkdir()
+    (tmp_path / "restored" / "__init__.py").write_text("")
+    (tmp_path / "restored" / "sub.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    restored = importlib.import_module("restored")
+    snapshot = dict(sys.modules)
+    assert imports_submodule(FILE1, 0, "restored", "sub") is True
+    assert "restored.sub" in sys.modules
+    assert restore_modules(snapshot) == 1
+    assert "restored.sub" not in sys.modules
+    assert not hasattr(restored, "sub")
+    assert sys.modules["restored"] is restored
+    del sys.modules["restored"]
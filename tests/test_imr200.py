@@ -47,3 +47,92 @@ class Test_IMR200(BaseTest):
         """
         result = self.run_flake8(code)
         self.assert_error_at(result, "IMR200", 3, 5)
+
+    def test_pass_type_checking(self):
+        code = """
+        import typing
+        from typing import TYPE_CHECKING
+
+        def x():
+            if TYPE_CHECKING:
+                import os
+            if typing.TYPE_CHECKING:
+                from os import path
+        """
+        result = self.run_flake8(code)
+        assert result == []
+
+    def test_fail_type_checking_else(self):
+        code = """
+        from typing import TYPE_CHECKING
+
+        def x():
+            if TYPE_CHECKING:
+                import os
+            else:
+                import sys
+        """
+        result = self.run_flake8(code)
+        assert len(result) == 1
+        self.assert_error_at(result, "IMR200", 8, 9)
+
+    def test_pass_lazy_threshold(self):
+        (self.flake8_path / "importtime.log").write_text(
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       900 |       2500 | heavy\n"
+            "import time:       100 |        100 |   heavy.sub\n"
+        )
+        code = """
+        def x():
+            import heavy
+            from heavy import sub
+            from heavy.sub import func
+        """
+        result = self.run_flake8(
+            code,
+            [
+                "--imr200_import_times=importtime.log",
+                "--imr200_lazy_threshold=2",
+            ],
+        )
+        assert result == []
+
+    def test_missing_import_times(self):
+        (self.flake8_path / "example.py").write_text("import os\n")
+        result = self.flake8_path.run_flake8(
+            ["--imr200_import_times=nope.log", "--imr200_lazy_threshold=5"]
+        )
+        assert result.exit_code == 1
+        assert "cannot read --imr200_import_times" in result.out
+        assert "Traceback" not in result.out + result.err
+
+    def test_fail_lazy_threshold(self):
+        (self.flake8_path / "importtime.log").write_text(
+            "import time:       900 |       2500 | heavy\n"
+            "import time:       100 |        100 | light\n"
+        )
+        code = """
+        def x():
+            import light
+            import heavy, light
+        """
+        result = self.run_flake8(
+            code,
+            [
+                "--imr200_import_times=importtime.log",
+                "--imr200_lazy_threshold=2",
+            ],
+        )
+        assert len(result) == 2
+        self.assert_error_at(result, "IMR200", 3, 5)
+        self.assert_error_at(result, "IMR200", 4, 5)
+
+    def test_fail_nested(self):
+        code = """
+        def x():
+            def y():
+                import os
+        """
+        result = self.run_flake8(code)
+        assert len(result) == 1
+        self.assert_error_at(result, "IMR200", 4, 9)
@@ -1,3 +1,9 @@
+import os
+
+from flake8.main import application
+
+from flake8_import_restrictions.checker import ImportChecker
+from flake8_import_restrictions.shared_cache import ENVIRONMENT_VARIABLE
 from tests.util import BaseTest
 
 
@@ -47,3 +53,96 @@ class Test_IMR241(BaseTest):
         }
         result = self.run_flake8_multifile(files)
         assert result == []
+
+    def test_static_resolution(self):
+        main_code = """
+        from test.test2 import testmodule
+        from test import test2
+        from test.test2.testmodule import func
+        """
+        files = {
+            "main.py": main_code,
+            "test/__init__.py": "",
+            "test/test2/__init__.py": "",
+            "test/test2/testmodule.py": "def func(): pass",
+        }
+        result = self.run_flake8_multifile(files, ["--imr_static_resolution"])
+        assert len(result) == 1
+        self.assert_error_at(result, "IMR241", 4, 1)
+
+    def test_restore_modules(self):
+        files = {
+            "main.py": """
+            from mod import sub
+            from mod.sub import func
+            """,
+            "other.py": "from mod.sub import func\n",
+            "mod/__init__.py": "",
+            "mod/sub.py": "def func(): pass",
+        }
+        result = self.run_flake8_multifile(files, ["--imr_restore_modules=1"])
+        assert sorted((report.file, report.line) for report in result) == [
+            ("./main.py", 3),
+            ("./other.py", 1),
+        ]
+
+    def test_parallel_jobs(self):
+        files = {
+            f"main{i}.py": """
+            from os import path
+            from os.path import join
+            """
+            for i in range(4)
+        }
+        result = self.run_flake8_multifile(files, ["--jobs=2"])
+        assert len(result) == 4
+        assert {report.line for report in result} == {3}
+
+    def test_parallel_jobs_share_resolutions(self, monkeypatch, capsys):
+        for i in range(4):
+            (self.flake8_path / f"main{i}.py").write_text(
+                "from os import path\n"
+            )
+        monkeypatch.chdir(self.flake8_path)
+        monkeypatch.delenv(ENVIRONMENT_VARIABLE, raising=False)
+        monkeypatch.setattr(ImportChecker, "shared_cache", None)
+        try:
+            application.Application().run(["--jobs=2", "--select=IMR", "."])
+            cache = ImportChecker.shared_cache
+            assert cache is not None
+            # The files were checked in the worker processes only, which published their results in the table.
+            assert ("os", "path") not in ImportChecker.resolutions
+            assert cache.get("os", "path") == (True, True)
+        finally:
+            if ImportChecker.shared_cache is not None:
+                ImportChecker.shared_cache.close()
+            os.environ.pop(ENVIRONMENT_VARIABLE, None)
+        assert capsys.readouterr().out == ""
+
+    def test_targets(self):
+        files = {
+            "main.py": "from versioned import sub\n",
+            "versioned/__init__.py": "",
+            "versioned/sub.py": "",
+            # Before the submodule was introduced, "sub" was an attribute.
+            "old/versioned/__init__.py": "sub = 1\n",
+            "new/unrelated.py": "",
+        }
+        result = self.run_flake8_multifile(
+            files, ["--imr_targets=old=old,new=new"]
+        )
+        assert [report.message for report in result] == [
+            "from-import statements must only import modules. (target: old) "
+            "(hint: Import the containing module instead.)"
+        ]
+
+    def test_targets_extension_modules(self):
+        files = {
+            "main.py": "from numpyish import _core\n",
+            "numpyish/__init__.py": "",
+            "numpyish/_core.py": "",
+            "py38/numpyish/__init__.py": "",
+            "py38/numpyish/_core.cpython-38-x86_64-linux-gnu.so": "",
+        }
+        result = self.run_flake8_multifile(files, ["--imr_targets=py38=py38"])
+        assert result == []
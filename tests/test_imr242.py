@@ -33,3 +33,30 @@ class Test_IMR242(BaseTest):
         """
         result = self.run_flake8(code)
         self.assert_error_at(result, "IMR242", 2, 1)
+
+    def test_static_resolution_not_importable(self):
+        files = {
+            "main.py": """
+            from broken import sub
+            from broken.sub import func
+            """,
+            "broken/__init__.py": "raise RuntimeError('not importable')",
+            "broken/sub.py": "def func(): pass",
+        }
+        result = self.run_flake8_multifile(
+            files, ["--imr_static_resolution", "--imr_no_import_fallback"]
+        )
+        assert len(result) == 1
+        self.assert_error_at(result, "IMR242", 2, 1)
+
+    def test_targets(self):
+        files = {
+            "main.py": "from versioned import sub\n",
+            "versioned/__init__.py": "sub = 1\n",
+            "new/versioned/__init__.py": "",
+            "new/versioned/sub.py": "",
+        }
+        result = self.run_flake8_multifile(files, ["--imr_targets=new=new"])
+        assert len(result) == 1
+        assert "(target: new)" in result[0].message
+        self.assert_error_at(result, "IMR242", 1, 1)
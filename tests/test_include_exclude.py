@@ -50,3 +50,24 @@ class Test_IncludeExclude:
         code = "import os.path"
         result = self.run_flake8(code, ["os.path"], ["*"])
         assert result == []
+
+    def test_directory_overrides(self):
+        (self.flake8_path / "legacy" / "vendored").mkdir(parents=True)
+        (self.flake8_path / "legacy" / "setup.cfg").write_text(
+            "[flake8-import-restrictions]\nimr222_exclude = os\n"
+        )
+        (self.flake8_path / "legacy" / "vendored" / "tox.ini").write_text(
+            "[flake8-import-restrictions]\nimr222_include = sys\n"
+        )
+        for directory in ["", "legacy/", "legacy/vendored/"]:
+            (self.flake8_path / f"{directory}example.py").write_text(
+                "import os\nimport sys\n"
+            )
+        result = self.run_flake8("import os\nimport sys\n", ["*"], [])
+        reported = sorted((report.file, report.line) for report in result)
+        assert reported == [
+            ("./example.py", 1),
+            ("./example.py", 2),
+            ("./legacy/example.py", 2),
+            ("./legacy/vendored/example.py", 2),
+        ]
@@ -0,0 +1,138 @@
+import argparse
+
+import pytest
+
+from flake8_import_restrictions import __main__
+from flake8_import_restrictions.checker import ImportChecker
+from flake8_import_restrictions.sharding import (
+    ShardResults,
+    cacheable_resolutions,
+    parse_shard,
+    partition,
+)
+
+
+@pytest.fixture(autouse=True)
+def _in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+
+def _write_files(tmp_path, sizes):
+    for name, size in sizes.items():
+        (tmp_path / name).write_text("x" * size)
+    return list(sizes)
+
+
+def test_partition_by_size(tmp_path):
+    filenames = _write_files(
+        tmp_path, {"a.py": 100, "b.py": 60, "c.py": 50, "d.py": 10}
+    )
+    assert partition(filenames, 2, {}) == [["a.py", "d.py"], ["b.py", "c.py"]]
+    assert partition(reversed(filenames), 2, {}) == partition(filenames, 2, {})
+    assert partition(filenames, 5, {})[4] == []
+
+
+def test_partition_by_cost(tmp_path):
+    filenames = _write_files(
+        tmp_path, {"a.py": 100, "b.py": 100, "c.py": 100, "d.py": 100}
+    )
+    # c.py and d.py are estimated from their size, at the average cost per byte of a.py and b.py.
+    costs = {"a.py": 3.0, "b.py": 0.5}
+    assert partition(filenames, 2, costs) == [
+        ["a.py", "b.py"],
+        ["c.py", "d.py"],
+    ]
+
+
+def test_parse_shard():
+    assert parse_shard("2/8") == (2, 8)
+    for value in ("0/2", "3/2", "1", "a/b"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(value)
+
+
+def test_merge():
+    first = ShardResults(
+        [("b.py", 1, 1, "IMR201")],
+        {"b.py": 1.0},
+        {("os", "path"): True, ("json", "x"): False},
+        "env",
+    )
+    second = ShardResults(
+        [("a.py", 2, 1, "IMR200")],
+        {"a.py": 2.0},
+        {("os", "path"): True, ("json", "x"): None, ("re", "sub"): False},
+        "env",
+    )
+    merged = ShardResults.merge([first, second])
+    assert merged.reports == [
+        ("a.py", 2, 1, "IMR200"),
+        ("b.py", 1, 1, "IMR201"),
+    ]
+    assert merged.costs == {"a.py": 2.0, "b.py": 1.0}
+    assert merged.resolutions == {("os", "path"): True, ("re", "sub"): False}
+    second.environment = "other"
+    assert ShardResults.merge([first, second]).resolutions == {}
+
+
+def test_save_and_load(tmp_path):
+    results = ShardResults(
+        [("a.py", 2, 1, "IMR200")], {"a.py": 0.5}, {("os", "path"): True}, "env"
+    )
+    results.save(str(tmp_path / "results.json"))
+    loaded = ShardResults.load(str(tmp_path / "results.json"))
+    assert vars(loaded) == vars(results)
+    (tmp_path / "bad.json").write_text('{"version": 1}')
+    with pytest.raises(ValueError):
+        ShardResults.load(str(tmp_path / "bad.json"))
+
+
+def test_cacheable_resolutions(tmp_path):
+    (tmp_path / "project").mkdir()
+    (tmp_path / "project" / "__init__.py").write_text("")
+    assert cacheable_resolutions(
+        {
+            ("os", "path"): True,
+            ("sys", "path"): False,
+            ("project", "x"): False,
+            ("not_installed", "x"): None,
+        }
+    ) == {("os", "path"): True, ("sys", "path"): False}
+
+
+def test_shards_and_merge(tmp_path, capsys):
+    (tmp_path / "pkg").mkdir()
+    for index in range(6):
+        (tmp_path / "pkg" / f"m{index}.py").write_text(
+            "import os as o\nfrom os import path\n"
+        )
+    for index in (1, 2, 3):
+        assert (
+            __main__.main(
+                ["pkg", f"--shard={index}/3", f"--results=shard{index}.json"]
+            )
+            == 1
+        )
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 6
+    assert len({line.split(":")[0] for line in lines}) == 6
+    shards = [ShardResults.load(f"shard{index}.json") for index in (1, 2, 3)]
+    assert [len(shard.costs) for shard in shards] == [2, 2, 2]
+
+    assert (
+        __main__.main(
+            ["--merge", "shard1.json", "shard2.json", "shard3.json"]
+            + ["--cache=cache.json"]
+        )
+        == 1
+    )
+    assert capsys.readouterr().out.splitlines() == sorted(lines)
+    cache = ShardResults.load("cache.json")
+    assert cache.reports == []
+    assert len(cache.costs) == 6
+    assert cache.resolutions == {("os", "path"): True}
+
+    ImportChecker.resolutions = {}
+    __main__.main(["pkg", "--shard=1/3", "--cache=cache.json"])
+    assert ImportChecker.resolutions == {("os", "path"): True}
@@ -0,0 +1,80 @@
+import multiprocessing
+import os
+
+from flake8_import_restrictions.shared_cache import (
+    ENVIRONMENT_VARIABLE,
+    SharedResolutionCache,
+    open_shared_cache,
+)
+
+
+def _publish(name: str) -> None:
+    cache = SharedResolutionCache(name)
+    cache.put("os", "path", True)
+    cache.close()
+
+
+def test_get_put():
+    cache = SharedResolutionCache(slots=64)
+    try:
+        assert cache.get("os", "path") == (False, None)
+        cache.put("os", "path", True)
+        cache.put("os", "environ", False)
+        cache.put("broken", "x", None)
+        assert cache.get("os", "path") == (True, True)
+        assert cache.get("os", "environ") == (True, False)
+        assert cache.get("broken", "x") == (True, None)
+    finally:
+        cache.close()
+
+
+def test_full_table():
+    cache = SharedResolutionCache(slots=4)
+    try:
+        for i in range(10):
+            cache.put("module", str(i), True)
+        found = [cache.get("module", str(i))[0] for i in range(10)]
+        assert sum(found) == 4
+    finally:
+        cache.close()
+
+
+def test_other_process():
+    cache = SharedResolutionCache(slots=64)
+    try:
+        process = multiprocessing.get_context("spawn").Process(
+            target=_publish, args=(cache.name,)
+        )
+        process.start()
+        process.join()
+        assert cache.get("os", "path") == (True, True)
+    finally:
+        cache.close()
+
+
+def _attach(queue: "multiprocessing.Queue", directory: str) -> None:
+    os.chdir(directory)
+    cache = open_shared_cache(64)
+    queue.put(cache.get("os", "path"))
+    cache.close()
+
+
+def test_workers_attach_in_same_scope(tmp_path, monkeypatch):
+    monkeypatch.delenv(ENVIRONMENT_VARIABLE, raising=False)
+    cache = open_shared_cache(64)
+    try:
+        cache.put("os", "path", True)
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        for directory, expected in (
+            (os.getcwd(), (True, True)),
+            # E.g. a flake8 run in another project, started by this one.
+            (str(tmp_path), (False, None)),
+        ):
+            process = context.Process(target=_attach, args=(queue, directory))
+            process.start()
+            assert queue.get(timeout=60) == expected
+            process.join()
+    finally:
+        cache.close()
+        os.environ.pop(ENVIRONMENT_VARIABLE, None)
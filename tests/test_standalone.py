@@ -0,0 +1,64 @@
+import os
+import textwrap
+
+import pytest
+
+from flake8_import_restrictions import __main__, standalone
+from flake8_import_restrictions.checker import ImportChecker
+
+
+@pytest.fixture(autouse=True)
+def _in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+
+def test_check_source():
+    standalone.parse_args([])
+    reports = standalone.check_source(
+        "from os.path import join\nimport os as o\n", "example.py"
+    )
+    assert [
+        (line, col, message.split()[0]) for _, line, col, message in reports
+    ] == [
+        (1, 1, "IMR241"),
+        (2, 1, "IMR201"),
+    ]
+
+
+def test_config(tmp_path):
+    (tmp_path / "setup.cfg").write_text(
+        "[flake8]\nimr241_exclude = os.*\nimr_static_resolution = true\n"
+    )
+    standalone.parse_args([])
+    assert ImportChecker.static_resolver is not None
+    assert standalone.check_source("from os.path import join\n", "x.py") == []
+
+
+def test_main(tmp_path, capsys):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("import os as o\n")
+    (tmp_path / "pkg" / "b.py").write_text("import os\n")
+    assert __main__.main(["pkg"]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        f"{os.path.join('pkg', 'a.py')}:1:1: IMR201 Import aliases must be at least two characters long. (hint: Choose a longer alias after the \"as\" keyword.)"
+    ]
+    assert __main__.main([os.path.join("pkg", "b.py")]) == 0
+
+
+def test_invalidate(tmp_path):
+    standalone.parse_args([])
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "__init__.py").write_text("")
+    (tmp_path / "lib" / "util.py").write_text("")
+    code = textwrap.dedent(
+        """
+        from lib import util
+        """
+    )
+    assert standalone.check_source(code, "main.py") == []
+    (tmp_path / "lib" / "util.py").unlink()
+    (tmp_path / "lib" / "__init__.py").write_text("def util(): pass\n")
+    standalone.invalidate(str(tmp_path / "lib" / "util.py"))
+    standalone.invalidate(str(tmp_path / "lib" / "__init__.py"))
+    assert len(standalone.check_source(code, "main.py")) == 1
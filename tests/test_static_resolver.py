@@ -0,0 +1,214 @@
+import os.path
+import sys
+
+from flake8_import_restrictions.static_resolver import StaticResolver
+
+FILE1 = __file__
+FILE2 = os.path.join(os.path.dirname(__file__), "resources", "dummy.py")
+FILE3 = os.path.join(os.path.dirname(__file__), "resources", "a", "x.py")
+
+
+def _resolver() -> StaticResolver:
+    return StaticResolver(sys.path + [os.getcwd()])
+
+
+def test_absolute():
+    resolver = _resolver()
+    assert resolver.imports_submodule(FILE1, 0, "tests.resources", "a")
+    assert resolver.imports_submodule(FILE1, 0, "tests.resources", "b")
+    assert (
+        resolver.imports_submodule(FILE1, 0, "tests.resources.b", "B") is False
+    )
+    assert (
+        resolver.imports_submodule(FILE1, 0, "tests.resources.b", "C") is False
+    )
+
+
+def test_relative():
+    resolver = _resolver()
+    assert resolver.imports_submodule(FILE1, 1, "resources.a", "c")
+    assert resolver.imports_submodule(FILE2, 1, "a.c", "C") is False
+    assert resolver.imports_submodule(FILE2, 2, "resources.a", "c")
+    assert resolver.imports_submodule(FILE3, 2, "b", "B") is False
+    assert resolver.imports_submodule(FILE3, 3, "resources.b", "B") is False
+
+
+def test_undecidable():
+    resolver = _resolver()
+    # Builtin modules have no source to inspect.
+    assert resolver.imports_submodule(FILE1, 0, "sys", "path") is None
+    assert resolver.imports_submodule(FILE1, 0, "does_not_exist", "x") is None
+
+
+def test_package_bindings(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text(
+        "from . import sub\n"
+        "from .other import func as other\n"
+        "import json as js\n"
+        "CONSTANT = 1\n"
+    )
+    (tmp_path / "pkg" / "sub.py").write_text("")
+    (tmp_path / "pkg" / "other.py").write_text("def func(): pass\n")
+    (tmp_path / "ns" / "inner").mkdir(parents=True)
+    (tmp_path / "ns" / "inner" / "mod.py").write_text("")
+    resolver = StaticResolver([str(tmp_path)])
+    assert resolver.resolve("pkg", "sub") is True
+    assert resolver.resolve("pkg", "other") is None
+    assert resolver.resolve("pkg", "js") is True
+    assert resolver.resolve("pkg", "CONSTANT") is False
+    assert resolver.resolve("pkg", "missing") is False
+    assert resolver.resolve("ns", "inner") is True
+    assert resolver.resolve("ns.inner", "mod") is True
+    assert resolver.resolve("ns.inner", "missing") is False
+
+
+def test_dynamic_namespace(tmp_path):
+    (tmp_path / "lazy.py").write_text("def __getattr__(name): pass\n")
+    (tmp_path / "star.py").write_text("from os import *\n")
+    resolver = StaticResolver([str(tmp_path)])
+    assert resolver.resolve("lazy", "anything") is None
+    assert resolver.resolve("star", "path") is None
+
+
+def test_prefetch(tmp_path):
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "sub" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "sub" / "mod.py").write_text("")
+    resolver = StaticResolver([str(tmp_path)], max_workers=4)
+    resolver.prefetch([("pkg.sub", "mod"), ("pkg", "missing")])
+    assert str(tmp_path / "pkg" / "sub") in resolver._listings
+    assert resolver.resolve("pkg.sub", "mod") is True
+    assert resolver.resolve("pkg", "missing") is False
+
+
+def test_directories_listed_once(tmp_path, monkeypatch):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    for name in ["a", "b", "c"]:
+        (tmp_path / "pkg" / f"{name}.py").write_text("")
+    listed = []
+    original_scandir = os.scandir
+
+    def scandir(path):
+        listed.append(path)
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    resolver = StaticResolver([str(tmp_path)], max_workers=1)
+    for name in ["a", "b", "c", "d"]:
+        assert resolver.resolve("pkg", name) is (name != "d")
+    assert sorted(listed) == sorted([str(tmp_path), str(tmp_path / "pkg")])
+
+
+def test_stub_packages(tmp_path):
+    # An extension module with inline stubs.
+    (tmp_path / "fast.abi3.so").write_text("")
+    (tmp_path / "fast.pyi").write_text("def func() -> None: ...\n")
+    # A package that is not installed at all, but has a stub-only package.
+    (tmp_path / "gpu-stubs").mkdir()
+    (tmp_path / "gpu-stubs" / "__init__.pyi").write_text(
+        "from . import kernels as kernels\nVERSION: str\n"
+    )
+    (tmp_path / "gpu-stubs" / "kernels.pyi").write_text(
+        "def run() -> None: ...\n"
+    )
+    resolver = StaticResolver([str(tmp_path)])
+    assert resolver.resolve("fast", "func") is False
+    assert resolver.resolve("gpu", "kernels") is True
+    assert resolver.resolve("gpu", "VERSION") is False
+    assert resolver.resolve("gpu.kernels", "run") is False
+
+
+def test_stub_exports(tmp_path):
+    (tmp_path / "lib-stubs").mkdir()
+    (tmp_path / "lib-stubs" / "__init__.pyi").write_text(
+        "import json\n"
+        "import os as os\n"
+        "import _thread as _thread\n"
+        "from . import sub\n"
+        "from .sub import helper\n"
+        "from .sub import Helper as Helper\n"
+    )
+    (tmp_path / "lib-stubs" / "sub.pyi").write_text(
+        "def helper() -> None: ...\nclass Helper: ...\n"
+    )
+    resolver = StaticResolver([str(tmp_path)])
+    # Imports without "as" and private names are not part of the stub's namespace.
+    assert resolver.resolve("lib", "json") is False
+    assert resolver.resolve("lib", "_thread") is False
+    assert resolver.resolve("lib", "helper") is False
+    assert resolver.resolve("lib", "os") is True
+    assert resolver.resolve("lib", "Helper") is False
+    # The submodule is still found as a file.
+    assert resolver.resolve("lib", "sub") is True
+
+
+def test_stub_paths(tmp_path):
+    (tmp_path / "stdlib" / "sys").mkdir(parents=True)
+    (tmp_path / "stdlib" / "sys" / "__init__.pyi").write_text(
+        "path: list[str]\n"
+    )
+    assert StaticResolver([]).resolve("sys", "path") is None
+    resolver = StaticResolver([], stub_paths=[str(tmp_path / "stdlib")])
+    assert resolver.resolve("sys", "path") is False
+
+
+def test_incomplete_stubs(tmp_path):
+    (tmp_path / "partial-stubs").mkdir()
+    (tmp_path / "partial-stubs" / "__init__.pyi").write_text(
+        "def __getattr__(name: str): ...\n"
+    )
+    assert StaticResolver([str(tmp_path)]).resolve("partial", "x") is None
+
+
+def test_meta_path_hooks(tmp_path, monkeypatch):
+    class Hook:
+        @staticmethod
+        def find_spec(name, path, target=None):
+            return object() if name == "hooked" else None
+
+    (tmp_path / "hooked.py").write_text("x = 1\n")
+    (tmp_path / "plain.py").write_text("x = 1\n")
+    monkeypatch.setattr(sys, "meta_path", [Hook()] + sys.meta_path)
+    resolver = StaticResolver([str(tmp_path)])
+    assert resolver.resolve("hooked", "x") is None
+    assert resolver.resolve("plain", "x") is False
+
+
+def test_extension_suffixes(tmp_path):
+    (tmp_path / "ext").mkdir()
+    (tmp_path / "ext" / "__init__.py").write_text("")
+    (tmp_path / "ext" / "_core.cpython-38-x86_64-linux-gnu.so").write_text("")
+    (tmp_path / "ext" / "_speedups.cp38-win_amd64.pyd").write_text("")
+    (tmp_path / "ext" / "_abi3.abi3.so").write_text("")
+    (tmp_path / "ext" / "_other.txt").write_text("")
+    paths = [str(tmp_path)]
+    py38 = StaticResolver(
+        paths, extension_suffixes=[".cpython-38-x86_64-linux-gnu.so"]
+    )
+    assert py38.resolve("ext", "_core") is True
+    py311 = StaticResolver(
+        paths, extension_suffixes=[".cpython-311-x86_64-linux-gnu.so"]
+    )
+    assert py311.resolve("ext", "_core") is False
+    resolver = StaticResolver(paths, extension_suffixes=None)
+    for name in ("_core", "_speedups", "_abi3"):
+        assert resolver.resolve("ext", name) is True
+    assert resolver.resolve("ext", "_other") is not True
+
+
+def test_builtin_module_names(tmp_path):
+    (tmp_path / "gone.py").write_text("x = 1\n")
+    paths = [str(tmp_path)]
+    assert (
+        StaticResolver(paths, builtin_module_names=()).resolve("gone", "x")
+        is False
+    )
+    assert (
+        StaticResolver(paths, builtin_module_names={"gone"}).resolve(
+            "gone", "x"
+        )
+        is None
+    )
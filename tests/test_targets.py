@@ -0,0 +1,44 @@
+import importlib.machinery
+import os
+import sys
+
+import pytest
+
+from flake8_import_restrictions import standalone
+from flake8_import_restrictions.targets import parse_targets
+
+
+def test_parse_targets(tmp_path):
+    first, second = str(tmp_path / "a"), str(tmp_path / "b")
+    targets = parse_targets([f"py38={first}{os.pathsep}{second}", "py39=c"])
+    assert list(targets) == ["py38", "py39"]
+    assert targets["py38"].paths == [first, second]
+    assert targets["py39"].paths == ["c"]
+    assert targets["py38"].extension_suffixes is None
+
+
+def test_interpreter():
+    target = parse_targets([f"current={sys.executable}"])["current"]
+    assert target.paths
+    assert all(os.path.isdir(path) for path in target.paths)
+    assert os.path.dirname(os.__file__) in target.paths
+    assert target.extension_suffixes == importlib.machinery.EXTENSION_SUFFIXES
+    assert target.builtin_module_names == set(sys.builtin_module_names)
+
+
+@pytest.mark.parametrize(
+    "entries", [["py38"], ["=a"], ["py38="], ["a=x", "a=y"]]
+)
+def test_invalid_targets(entries):
+    with pytest.raises(ValueError):
+        parse_targets(entries)
+
+
+def test_failing_interpreter(tmp_path, capsys):
+    (tmp_path / "python").write_text("")
+    with pytest.raises(ValueError) as info:
+        parse_targets([f"broken={tmp_path / 'python'}"])
+    assert isinstance(info.value.__cause__, OSError)
+    with pytest.raises(SystemExit):
+        standalone.parse_args([f"--imr_targets=broken={tmp_path / 'python'}"])
+    assert "invalid --imr_targets" in capsys.readouterr().err
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from flake8_import_restrictions import standalone, watch
+
+
+@pytest.fixture(autouse=True)
+def _in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+
+def _touch(path, text):
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def _codes(results):
+    return {
+        filename: [message.split()[0] for _, _, _, message in reports]
+        for filename, reports in results.items()
+    }
+
+
+def test_recheck_dependents(tmp_path):
+    standalone.parse_args([])
+    (tmp_path / "watched").mkdir()
+    (tmp_path / "watched" / "__init__.py").write_text("")
+    (tmp_path / "watched" / "util.py").write_text("")
+    (tmp_path / "main.py").write_text("from watched import util\n")
+    (tmp_path / "other.py").write_text("import os\n")
+    watcher = watch.Watcher(["."])
+    assert _codes(watcher.check_all()) == {
+        os.path.join(".", "watched", "__init__.py"): [],
+        os.path.join(".", "watched", "util.py"): [],
+        os.path.join(".", "main.py"): [],
+        os.path.join(".", "other.py"): [],
+    }
+    assert watcher.poll() == {}
+
+    (tmp_path / "watched" / "util.py").unlink()
+    _touch(tmp_path / "watched" / "__init__.py", "def util(): pass\n")
+    assert _codes(watcher.poll()) == {
+        os.path.join(".", "watched", "__init__.py"): [],
+        os.path.join(".", "watched", "util.py"): [],
+        os.path.join(".", "main.py"): ["IMR241"],
+    }
+    assert os.path.join(".", "watched", "util.py") not in watcher.reports
+
+
+def test_config_change_rechecks_all(tmp_path):
+    standalone.parse_args([])
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.py").write_text("from os.path import join\n")
+    (tmp_path / "b.py").write_text("import os\n")
+    watcher = watch.Watcher(["."])
+    watcher.check_all()
+    _touch(
+        tmp_path / "sub" / "setup.cfg",
+        "[flake8-import-restrictions]\nimr241_exclude = os.*\n",
+    )
+    assert _codes(watcher.poll()) == {
+        os.path.join(".", "sub", "a.py"): [],
+        os.path.join(".", "b.py"): [],
+    }
+
+
+def test_run(tmp_path):
+    standalone.parse_args([])
+    (tmp_path / "a.py").write_text("import os as o\n")
+    outputs = []
+    watch.Watcher(["."]).run(0, outputs.append, iterations=1)
+    assert [_codes(results) for results in outputs] == [
+        {os.path.join(".", "a.py"): ["IMR201"]}
+    ]
+
+
+@pytest.mark.parametrize("options", [[], ["--imr_static_resolution"]])
+def test_recheck_importers_of_reexported_names(tmp_path, options):
+    standalone.parse_args(options)
+    (tmp_path / "reexporting").mkdir()
+    (tmp_path / "reexporting" / "__init__.py").write_text(
+        "from .impl import thing\n"
+    )
+    (tmp_path / "reexporting" / "impl.py").write_text("def thing(): pass\n")
+    (tmp_path / "main.py").write_text("from reexporting import thing\n")
+    watcher = watch.Watcher(["."])
+    assert _codes(watcher.check_all())[os.path.join(".", "main.py")] == [
+        "IMR241"
+    ]
+
+    _touch(tmp_path / "reexporting" / "impl.py", "import json as thing\n")
+    assert _codes(watcher.poll()) == {
+        os.path.join(".", "reexporting", "__init__.py"): [],
+        os.path.join(".", "reexporting", "impl.py"): [],
+        os.path.join(".", "main.py"): [],
+    }